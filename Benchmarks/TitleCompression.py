@@ -0,0 +1,41 @@
+"""
+Сравнивает размер и скорость записи и чтения JSON тайтлов без сжатия и с каждым доступным алгоритмом сжатия. Также проверяет, что данные переживают цикл сжатия без изменений.
+
+Запуск из корня репозитория: `python -m Benchmarks.TitleCompression [--chapters N] [--repeats N]`.
+"""
+
+from Source.Core.Base.Formats.Components.Functions import CompressTitleData, DecompressTitleData, DeserializeTitleJSON, IsCompressionAvailable, SerializeTitleJSON, TITLE_COMPRESSIONS
+
+from Benchmarks.TitleJSON import Measure
+from Benchmarks.Titles import BuildManga, BuildRanobe
+
+import argparse
+
+def main():
+	Parser = argparse.ArgumentParser(description = "Title compression benchmark.")
+	Parser.add_argument("--chapters", type = int, default = 900, help = "Chapters count in generated titles.")
+	Parser.add_argument("--repeats", type = int, default = 3, help = "Repeats per measurement (median is reported).")
+	Arguments = Parser.parse_args()
+
+	Titles = {
+		"manga": BuildManga(Arguments.chapters, 60),
+		"ranobe": BuildRanobe(Arguments.chapters // 3, 150)
+	}
+	Compressions = [None]
+
+	for Compression in TITLE_COMPRESSIONS:
+		if IsCompressionAvailable(Compression): Compressions.append(Compression)
+		else: print(f"{Compression}: unavailable, skipped.")
+
+	print(f"{'title':<8} {'compression':<12} {'size MiB':>9} {'ratio':>6} {'write s':>8} {'read s':>8}")
+
+	for Name, Data in Titles.items():
+		PlainSize = len(SerializeTitleJSON(Data))
+
+		for Compression in Compressions:
+			WriteTime, Content = Measure(lambda Data: CompressTitleData(SerializeTitleJSON(Data), Compression), Data, Arguments.repeats)
+			ReadTime, Result = Measure(lambda Content: DeserializeTitleJSON(DecompressTitleData(Content)), Content, Arguments.repeats)
+			if Result != Data: raise RuntimeError(f"{Compression or 'none'} round trip changed {Name} data.")
+			print(f"{Name:<8} {Compression or 'none':<12} {len(Content) / 2 ** 20:>9.1f} {PlainSize / len(Content):>6.1f} {WriteTime:>8.3f} {ReadTime:>8.3f}")
+
+if __name__ == "__main__": main()
@@ -0,0 +1,89 @@
+"""
+Измеряет скорость записи и чтения JSON тайтлов кодеком Melon и сравнивает библиотеки десериализации. Также проверяет, что записанные файлы совпадают с выводом `WriteJSON` из dublib.
+
+Запуск из корня репозитория: `python -m Benchmarks.TitleJSON [--chapters N] [--repeats N]`.
+"""
+
+from Source.Core.Base.Formats.Components.Functions import DeserializeTitleJSON, JSON_BACKENDS, SelectTitleJSONBackend, SerializeTitleJSON
+
+from Benchmarks.Titles import BuildManga, BuildRanobe
+
+from dublib.Methods.Filesystem import WriteJSON
+
+from statistics import median
+from time import perf_counter
+import argparse
+import tempfile
+import os
+
+def Measure(function, argument, repeats: int) -> tuple[float, object]:
+	"""
+	Измеряет медианное время выполнения функции.
+
+	:param function: Измеряемая функция.
+	:param argument: Аргумент функции.
+	:param repeats: Количество повторов.
+	:type repeats: int
+	:return: Медианное время в секундах и результат последнего вызова.
+	:rtype: tuple[float, object]
+	"""
+
+	Times = list()
+
+	for _ in range(repeats):
+		Start = perf_counter()
+		Result = function(argument)
+		Times.append(perf_counter() - Start)
+
+	return median(Times), Result
+
+def ReadWriteJSONOutput(data: dict) -> bytes:
+	"""
+	Возвращает содержимое файла, записанного `WriteJSON` из dublib.
+
+	:param data: Словарь данных.
+	:type data: dict
+	:return: Содержимое файла.
+	:rtype: bytes
+	"""
+
+	with tempfile.TemporaryDirectory() as Directory:
+		Path = os.path.join(Directory, "title.json")
+		WriteJSON(Path, data)
+		with open(Path, "rb") as FileReader: return FileReader.read()
+
+def main():
+	Parser = argparse.ArgumentParser(description = "Title JSON codec benchmark.")
+	Parser.add_argument("--chapters", type = int, default = 3000, help = "Chapters count in generated titles.")
+	Parser.add_argument("--repeats", type = int, default = 3, help = "Repeats per measurement (median is reported).")
+	Arguments = Parser.parse_args()
+
+	Titles = {
+		"manga": BuildManga(Arguments.chapters, 60),
+		"ranobe": BuildRanobe(Arguments.chapters // 3, 150)
+	}
+	Backends = list()
+
+	for Backend in JSON_BACKENDS:
+		try: SelectTitleJSONBackend(Backend)
+		except ValueError: print(f"{Backend}: unavailable, skipped.")
+		else: Backends.append(Backend)
+
+	print(f"{'title':<8} {'size MiB':>9} {'write s':>8}  " + "  ".join(f"{'read ' + Backend + ' s':>14}" for Backend in Backends))
+
+	for Name, Data in Titles.items():
+		WriteTime, Content = Measure(SerializeTitleJSON, Data, Arguments.repeats)
+		if Content != ReadWriteJSONOutput(Data): raise RuntimeError(f"Serialized {Name} differs from WriteJSON output.")
+		ReadTimes = list()
+
+		for Backend in Backends:
+			SelectTitleJSONBackend(Backend)
+			ReadTime, Result = Measure(DeserializeTitleJSON, Content, Arguments.repeats)
+			if Result != Data: raise RuntimeError(f"{Backend} round trip changed {Name} data.")
+			ReadTimes.append(ReadTime)
+
+		print(f"{Name:<8} {len(Content) / 2 ** 20:>9.1f} {WriteTime:>8.3f}  " + "  ".join(f"{ReadTime:>14.3f}" for ReadTime in ReadTimes))
+
+	print("Serialized files match WriteJSON output.")
+
+if __name__ == "__main__": main()
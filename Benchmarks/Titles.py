@@ -0,0 +1,84 @@
+import random
+
+#==========================================================================================#
+# >>>>> ГЕНЕРАЦИЯ ТЕСТОВЫХ ТАЙТЛОВ <<<<< #
+#==========================================================================================#
+
+WORDS = ("глава", "свет", "тень", "город", "ветер", "путь", "chapter", "light", "shadow", "road")
+
+def BuildManga(chapters_count: int, slides_count: int) -> dict:
+	"""
+	Генерирует данные манги в формате _melon-manga_.
+
+	:param chapters_count: Количество глав.
+	:type chapters_count: int
+	:param slides_count: Количество слайдов в главе.
+	:type slides_count: int
+	:return: Словарь данных тайтла.
+	:rtype: dict
+	"""
+
+	Chapters = list()
+
+	for ChapterID in range(chapters_count):
+		Chapters.append({
+			"id": ChapterID,
+			"slug": f"chapter-{ChapterID}",
+			"volume": str(ChapterID // 10 + 1),
+			"number": str(ChapterID + 1),
+			"name": f"Глава {ChapterID + 1}",
+			"is_paid": False,
+			"workers": ["Translator"],
+			"slides": [{"index": Index + 1, "link": f"https://example.com/{ChapterID}/{Index}.jpg", "width": 800, "height": 1200} for Index in range(slides_count)]
+		})
+
+	return {
+		"format": "melon-manga",
+		"id": 1,
+		"slug": "benchmark-manga",
+		"localized_name": "Тестовая манга",
+		"content_language": "rus",
+		"branches": [{"id": 1, "chapters_count": chapters_count}],
+		"content": {"1": Chapters}
+	}
+
+def BuildRanobe(chapters_count: int, paragraphs_count: int, seed: int = 0) -> dict:
+	"""
+	Генерирует данные ранобэ в формате _melon-ranobe_.
+
+	:param chapters_count: Количество глав.
+	:type chapters_count: int
+	:param paragraphs_count: Количество абзацев в главе.
+	:type paragraphs_count: int
+	:param seed: Зерно генератора текста.
+	:type seed: int
+	:return: Словарь данных тайтла.
+	:rtype: dict
+	"""
+
+	Generator = random.Random(seed)
+	Chapters = list()
+
+	for ChapterID in range(chapters_count):
+		Paragraphs = [f"<p>{' '.join(Generator.choices(WORDS, k = 60))}.</p>" for _ in range(paragraphs_count)]
+
+		Chapters.append({
+			"id": ChapterID,
+			"slug": f"chapter-{ChapterID}",
+			"volume": str(ChapterID // 10 + 1),
+			"number": str(ChapterID + 1),
+			"name": f"Глава {ChapterID + 1}",
+			"is_paid": False,
+			"workers": ["Translator"],
+			"paragraphs": Paragraphs
+		})
+
+	return {
+		"format": "melon-ranobe",
+		"id": 2,
+		"slug": "benchmark-ranobe",
+		"localized_name": "Тестовое ранобэ",
+		"content_language": "rus",
+		"branches": [{"id": 1, "chapters_count": chapters_count}],
+		"content": {"1": Chapters}
+	}
@@ -1,8 +1,10 @@
 from Source.Core.Base.Builders.RanobeBuilder import RanobeBuilder
+from Source.Core.Base.Formats.Components.Functions import IsCompressionAvailable
 from Source.Core.Base.Formats.Components import By, ContentTypes
 from Source.Core.Base.Builders.MangaBuilder import MangaBuilder
 from Source.Core.Development import DevelopmeptAssistant
 from Source.Core.SystemObjects import SystemObjects
+from Source.Core.Converter import Converter
 from Source.Core.Collector import Collector
 from Source.Core.Installer import Installer
 from Source.Core.Cacher import Cacher
@@ -17,9 +19,11 @@ from dublib.CLI.Terminalyzer import ParsedCommandData
 from dublib.Methods.Filesystem import WriteJSON
 from dublib.Engine.Bus import ExecutionStatus
 
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from threading import Lock, local
 from json.decoder import JSONDecodeError
-from typing import TYPE_CHECKING
-from time import sleep
+from typing import Iterator, TYPE_CHECKING
+from itertools import islice
 import traceback
 
 if TYPE_CHECKING:
@@ -49,19 +53,19 @@ def com_build_manga(system_objects: SystemObjects, command: ParsedCommandData):
 			break
 
 	EntryPoint = system_objects.controller.get_entry_point()
-	Title: "Manga" = Title(system_objects)
+	Title: "Manga" = EntryPoint.create_title(ContentTypes.Manga)
 	Title.open(Filename, By.Filename)
-	Parser: "RanobeParser" = EntryPoint.launch_parser(ContentTypes.Ranobe)
+	Parser: "MangaParser" = EntryPoint.launch_parser(ContentTypes.Manga)
 	Title.set_parser(Parser)
 
 	Builder = MangaBuilder(system_objects, Parser)
 	Builder.select_build_system(BuildSystemName)
 	if command.check_key("ch-template"): Builder.set_chapter_name_template(command.get_key_value("ch-template"))
 	if command.check_key("vol-template"): Builder.set_volume_name_template(command.get_key_value("vol-template"))
-	Title.open(Filename)
+	if command.check_key("workers"): Builder.set_workers_count(command.get_key_value("workers"))
 	
-	if command.check_key("chapter"): Builder.build_chapter(Title, command.get_key_value("chapter"))
-	elif command.check_key("branch"): Builder.build_branch(Title, command.get_key_value("branch"))
+	if command.check_key("chapter"): Builder.build_chapter(Title, int(command.get_key_value("chapter")))
+	elif command.check_key("branch"): Builder.build_branch(Title, int(command.get_key_value("branch")))
 	else: Builder.build_branch(Title)
 	TimerObject.done()
 
@@ -168,6 +172,41 @@ def com_collect(system_objects: SystemObjects, command: ParsedCommandData):
 	CollectorObject.save(sort = IS_SORTING_ENABLED)
 	system_objects.logger.titles_collected(CollectedTitlesCount)
 
+def com_convert(system_objects: SystemObjects, command: ParsedCommandData):
+	"""
+	Преобразует способ хранения и сжатие описательных файлов парсера.
+		
+	:param system_objects: Коллекция системных объектов.
+	:type system_objects: SystemObjects
+	:param command: Данные команды.
+	:type command: ParsedCommandData
+	"""
+
+	system_objects.logger.header("Converting")
+	Filename = None
+	Sharded = None
+	Compression = command.get_key_value("compression") if command.check_key("compression") else None
+
+	if command.check_flag("sharded"): Sharded = True
+	elif command.check_flag("inline"): Sharded = False
+
+	if Sharded == None and not Compression:
+		PrintError("Specify storage layout or compression.")
+		return
+
+	if Compression and Compression != "none" and not IsCompressionAvailable(Compression):
+		PrintError(f"Unsupported compression: \"{Compression}\".")
+		return
+
+	if command.arguments:
+		Filename = command.arguments[0]
+		if Filename.endswith(".json"): Filename = Filename[:-5]
+
+	TimerObject = Timer(start = True)
+	Result = Converter(system_objects).convert_parser_output(system_objects.parser_name, Sharded, Compression, Filename)
+	Templates.ConvertingSummary(Result)
+	TimerObject.done()
+
 def com_get(system_objects: SystemObjects, command: ParsedCommandData):
 	"""
 	Скачивает изображение.
@@ -321,8 +360,10 @@ def com_parse(system_objects: SystemObjects, command: ParsedCommandData):
 	:type command: ParsedCommandData
 	"""
 
-	Slugs = list()
+	Slugs: "list[str] | Iterator[str]" = list()
 	StartIndex = 0
+	TotalCount = None
+	CollectionReader = None
 	system_objects.logger.header("Parsing")
 
 	IS_AMENDING_ENABLED = not command.check_flag("no-amend")
@@ -349,8 +390,10 @@ def com_parse(system_objects: SystemObjects, command: ParsedCommandData):
 		else: Slugs.append(system_objects.temper.shared_data.last_parsed_slug)
 			
 	elif command.check_flag("collection"):
-		Slugs = Collector(system_objects).slugs
-		system_objects.logger.info(f"Titles in collection: {len(Slugs)}.")
+		CollectionReader = Collector(system_objects, merge = False)
+		Slugs = CollectionReader.iterate()
+		TotalCount = CollectionReader.count()
+		system_objects.logger.info(f"Titles in collection: {TotalCount}.")
 
 	elif command.check_flag("updates"):
 		Period = int(command.get_key_value("period")) if command.check_key("period") else 24
@@ -385,55 +428,136 @@ def com_parse(system_objects: SystemObjects, command: ParsedCommandData):
 		
 	if command.check_key("from"):
 		system_objects.logger.info("Processing will be started from slug: \"" + command.get_key_value("from") + "\".")
-			
-		if command.get_key_value("from") in Slugs: StartIndex = Slugs.index(command.get_key_value("from"))
-		else: system_objects.logger.warning("No starting slug in collection. Ignored.")
-
-	ParsedCount = 0
-	NotFoundCount = 0
-	ErrorsCount = 0
-	TotalCount = len(Slugs)
-	Parser: "MangaParser | RanobeParser" = None
-
-	for Index in range(StartIndex, TotalCount):
-		if system_objects.CACHING: system_objects.temper.shared_data.set_last_parsed_slug(Slugs[Index])
-		ContentType = EntryPoint.get_content_type_by_slug(Slugs[Index])
-		if not Parser or ContentType != Parser.content_type: Parser = EntryPoint.launch_parser(ContentType)
-		Title = EntryPoint.create_title(ContentType, Slugs[Index])
+		StartSlug = command.get_key_value("from")
+		
+		if CollectionReader: StartIndex = CollectionReader.index(StartSlug)
+		elif StartSlug in Slugs: StartIndex = Slugs.index(StartSlug)
+		else: StartIndex = None
+
+		if StartIndex == None:
+			StartIndex = 0
+			system_objects.logger.warning("No starting slug in collection. Ignored.")
+
+	if TotalCount == None: TotalCount = len(Slugs)
+	WorkersCount = int(command.get_key_value("workers")) if command.check_key("workers") else 1
+	Summary = {"parsed": 0, "not_found": 0, "errors": 0}
+	ParsingTitles: dict[int, str] = dict()
+	LastStartedTitle: tuple[int, str] | None = None
+	Locker = Lock()
+	ParsersStorage = local()
+
+	def UpdateResumePoint(index: int, slug: str, is_started: bool):
+		"""
+		Отмечает начало или завершение параллельной обработки тайтла. Последним обработанным считается алиас самого раннего из обрабатываемых в данный момент тайтлов, поэтому возобновление не пропустит тайтлы, прерванные в других потоках. Если обрабатываемых тайтлов нет, им считается последний начатый тайтл, как и при последовательной обработке.
+
+		:param index: Индекс алиаса в списке.
+		:type index: int
+		:param slug: Алиас тайтла.
+		:type slug: str
+		:param is_started: Указывает, началась ли обработка тайтла (иначе – завершилась).
+		:type is_started: bool
+		"""
+
+		nonlocal LastStartedTitle
+		if not system_objects.CACHING: return
+
+		with Locker:
+
+			if is_started:
+				ParsingTitles[index] = slug
+				if not LastStartedTitle or index > LastStartedTitle[0]: LastStartedTitle = (index, slug)
+
+			else: ParsingTitles.pop(index, None)
+
+			ResumeSlug = ParsingTitles[min(ParsingTitles)] if ParsingTitles else LastStartedTitle[1]
+			system_objects.temper.shared_data.set_last_parsed_slug(ResumeSlug)
+
+	def ParseTitle(index: int, slug: str):
+		"""
+		Выполняет полный цикл обработки одного тайтла. Каждый поток использует собственные объекты парсеров.
+
+		:param index: Индекс алиаса в списке.
+		:type index: int
+		:param slug: Алиас тайтла.
+		:type slug: str
+		"""
+
+		Result = "errors"
+
+		if WorkersCount > 1:
+			system_objects.logger.set_thread_prefix(slug)
+			UpdateResumePoint(index, slug, True)
+
+		elif system_objects.CACHING: system_objects.temper.shared_data.set_last_parsed_slug(slug)
+
+		ContentType = EntryPoint.get_content_type_by_slug(slug)
+		Parser: "MangaParser | RanobeParser | None" = getattr(ParsersStorage, ContentType.value, None)
+
+		if not Parser:
+			Parser = EntryPoint.launch_parser(ContentType)
+			setattr(ParsersStorage, ContentType.value, Parser)
+
+		Title = EntryPoint.create_title(ContentType, slug)
 		Title.set_parser(Parser)
 
 		try:
 			TimerObject = Timer(start = True)
 			
-			Title.parse(Index, TotalCount)
+			Title.parse(index, TotalCount)
 			if not system_objects.FORCE_MODE: Title.merge()
 			if IS_AMENDING_ENABLED: Title.amend()
 			Title.download_images()
 			Title.save(sorting = IS_SORTING_ENABLED)
 
-			TimerObject.done()
-			ParsedCount += 1
-
-		except JSONDecodeError as ExceptionData:
-			system_objects.logger.error(str(ExceptionData))
-			ErrorsCount += 1
+			if WorkersCount > 1: system_objects.logger.info(f"Done in {TimerObject.ends()}.", log = False)
+			else: TimerObject.done()
+			Result = "parsed"
 
-		except Exceptions.UnsupportedFormat as ExceptionData:
-			system_objects.logger.error(str(ExceptionData))
-			ErrorsCount += 1
-
-		except Exceptions.TitleNotFound: NotFoundCount += 1
-		except Exceptions.ParsingError: ErrorsCount += 1
+		except JSONDecodeError as ExceptionData: system_objects.logger.error(str(ExceptionData))
+		except Exceptions.UnsupportedFormat as ExceptionData: system_objects.logger.error(str(ExceptionData))
+		except Exceptions.TitleNotFound: Result = "not_found"
+		except Exceptions.ParsingError: pass
 		
 		except Exception as ExceptionData:
 			print(FastStyler(traceback.format_exc().rstrip()).colorize.red)
 			system_objects.logger.error(f"Raised exception: \"{ExceptionData}\".", stdout = False)
 			system_objects.logger.warning("Current title skipped due to exception.")
-			ErrorsCount += 1
 
-		if Index != len(Slugs) - 1: sleep(EntryPoint.settings.common.delay)
+		finally:
+			with Locker: Summary[Result] += 1
+
+			if WorkersCount > 1:
+				UpdateResumePoint(index, slug, False)
+				system_objects.logger.set_thread_prefix(None)
+
+	Titles = islice(enumerate(Slugs), StartIndex, None)
+
+	if WorkersCount > 1:
+		system_objects.logger.info(f"Parsing titles in {WorkersCount} workers.")
+		Executor = ThreadPoolExecutor(max_workers = WorkersCount)
+		Futures = set()
+
+		try:
+
+			for Index, Slug in Titles:
+				Futures.add(Executor.submit(ParseTitle, Index, Slug))
+
+				if len(Futures) >= WorkersCount * 2:
+					Done, Futures = wait(Futures, return_when = FIRST_COMPLETED)
+					for Future in Done: Future.result()
+
+			for Future in as_completed(Futures): Future.result()
+
+		except KeyboardInterrupt:
+			Executor.shutdown(wait = False, cancel_futures = True)
+			raise
+
+		else: Executor.shutdown()
+
+	else:
+		for Index, Slug in Titles: ParseTitle(Index, Slug)
 
-	Templates.ParsingSummary(ParsedCount, NotFoundCount, ErrorsCount)
+	Templates.ParsingSummary(Summary["parsed"], Summary["not_found"], Summary["errors"])
 
 def com_repair(system_objects: SystemObjects, command: ParsedCommandData):
 	"""
@@ -18,6 +18,7 @@ ComPos.add_flag("cbz", "Make *.CBZ files.")
 Com.base.add_key("ch-template", description = "Template for chapters naming. Available {number} and {name} replacements.")
 Com.base.add_key("vol-template", description = "Template for volumes naming. Available {number} replacement.")
 Com.base.add_flag("v", description = "Enable chapters sorting by volumes directories.")
+Com.base.add_key("workers", ParametersTypes.Number, "Count of slides downloaded concurrently (default 1).")
 CommandsList.append(Com)
 
 Com = Command("build-ranobe", "Build readable ranobe.")
@@ -34,6 +35,17 @@ ComPos = Com.create_position("TARGET", "Target parser output catalog for caching
 ComPos.add_key("use", ParametersTypes.Alpha, "Parser name.")
 CommandsList.append(Com)
 
+Com = Command("convert", "Convert storage layout or compression of local titles.")
+ComPos = Com.create_position("LAYOUT", "Target storage layout.")
+ComPos.add_flag("inline", "Put chapters of all branches into title's JSON.")
+ComPos.add_flag("sharded", "Move chapters of every branch into separate shard.")
+ComPos = Com.create_position("PARSER", "Name of parser.", important = True)
+ComPos.add_key("use", ParametersTypes.Alpha, "Parser name.")
+ComPos = Com.create_position("SOURCE", "Title's data.")
+ComPos.add_argument(description = "Filename of local JSON (all files by default).")
+Com.base.add_key("compression", description = "Target compression: \"gzip\", \"zstd\" or \"none\".")
+CommandsList.append(Com)
+
 CollectionFileBold = FastStyler("Collection.txt").decorate.italic
 Com = Command("collect", f"Collect titles slugs into {CollectionFileBold} file.")
 ComPos = Com.create_position("PARSER", "Name of parser.", important = True)
@@ -96,6 +108,7 @@ ComPos = Com.create_position("PARSER", "Name of parser.", important = True)
 ComPos.add_key("use", ParametersTypes.Alpha, "Parser name.")
 Com.base.add_key("period", ParametersTypes.Number, "Period in hours for parsing. Use with -updates flag.")
 Com.base.add_key("from", description = "Skip titles before this slug.")
+Com.base.add_key("workers", ParametersTypes.Number, "Count of titles parsed concurrently (default 1).")
 Com.base.add_flag("f", "Enable force mode.")
 Com.base.add_flag("sort", "Enable chapters sorting after parsing.")
 Com.base.add_flag("no-amend", "Disable chapters content amending.")
@@ -26,6 +26,21 @@ def CachingSummary(result: "ExecutionStatus"):
 		print(FastStyler("Errors:").decorate.bold)
 		for Error in Errors: print(" - " + FastStyler(Error + ".json").colorize.red)
 
+def ConvertingSummary(result: "ExecutionStatus"):
+	"""
+	Выводит в консоль результат преобразования способа хранения описательных файлов.
+
+	:param result: Результат преобразования.
+	:type result: ExecutionStatus
+	"""
+
+	Errors: tuple[str] = result["errors"]
+	print(f"Total: {result['total']}. Skipped: {result['skipped']}. Converted: {result['converted']}.")
+
+	if Errors:
+		print(FastStyler("Errors:").decorate.bold)
+		for Error in Errors: print(" - " + FastStyler(Error + ".json").colorize.red)
+
 def OptionStatus(text: str, status: bool):
 	"""
 	Выводит в консоль форматированный статус опции.
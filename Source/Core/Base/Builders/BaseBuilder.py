@@ -28,8 +28,8 @@ class BaseBuilder:
 		if not branches: return None
 
 		for CurrentBranch in branches:
-			for CurrentChapter in CurrentBranch.chapters:
-				if CurrentChapter.id == chapter_id: return CurrentChapter
+			try: return CurrentBranch.get_chapter_by_id(chapter_id)
+			except KeyError: pass
 
 	def _GenerateChapterNameByTemplate(self, chapter: "BaseChapter") -> str:
 		"""
@@ -1,8 +1,13 @@
 from Source.Core.Base.Builders.BaseBuilder import BaseBuilder
+from Source.Core.Base.Parsers.Components.ImagesDownloader import ImageDownloadingStatus
 
-from dublib.Methods.Filesystem import ListDir, NormalizePath
+from dublib.Methods.Filesystem import NormalizePath
 
-from typing import TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, TYPE_CHECKING
+from pathlib import Path
+import hashlib
+import zipfile
 import shutil
 import enum
 import os
@@ -22,6 +27,8 @@ class MangaBuildSystems(enum.Enum):
 	ZIP = "zip"
 	CBZ = "cbz"
 
+COMPRESSED_IMAGES_TYPES = (".avif", ".gif", ".jpeg", ".jpg", ".png", ".webp")
+
 #==========================================================================================#
 # >>>>> ОСНОВНОЙ КЛАСС <<<<< #
 #==========================================================================================#
@@ -33,42 +40,207 @@ class MangaBuilder(BaseBuilder):
 	# >>>>> СИСТЕМЫ СБОРКИ <<<<< #
 	#==========================================================================================#
 
-	def __cbz(self, title: "Manga", chapter: "Chapter", directory: str) -> str:
+	def __cbz(self, title: "Manga", chapter: "Chapter", files: Iterator[tuple[str, str, bool]]) -> str:
 		"""Система сборки: *.CBZ-архив."""
 
-		ArchivePath = self.__zip(title, chapter, directory)
-		OutputPath = ArchivePath[:-3] + "cbz"
-		os.rename(ArchivePath, OutputPath)
-
-		return OutputPath
+		return self.__zip(title, chapter, files, "cbz")
 
-	def __simple(self, title: "Manga", chapter: "Chapter", directory: str) -> str:
+	def __simple(self, title: "Manga", chapter: "Chapter", files: Iterator[tuple[str, str, bool]]) -> str:
 		"""Система сборки: каталог с изображениями."""
 
-		ChapterName = self._GenerateChapterNameByTemplate(chapter)
-		Volume = ""
-		if self.__SortingByVolumes and chapter.volume: Volume = self._GenerateVolumeNameByTemplate(chapter)
-		OutputPath = f"{self._ParserSettings.common.archives_directory}/{title.used_filename}/{Volume}/{ChapterName}"
-		OutputPath = NormalizePath(OutputPath)
-
+		OutputPath = self.__GetOutputPath(title, chapter)
 		if not os.path.exists(OutputPath): os.makedirs(OutputPath)
-		Files = ListDir(directory)
-		for File in Files: os.replace(f"{directory}/{File}", f"{OutputPath}/{File}")
+
+		for Filename, FilePath, IsTemporary in files:
+			if IsTemporary: shutil.move(FilePath, f"{OutputPath}/{Filename}")
+			else: self.__LinkFile(FilePath, f"{OutputPath}/{Filename}")
 
 		return OutputPath
 
-	def __zip(self, title: "Manga", chapter: "Chapter", directory: str) -> str:
+	def __zip(self, title: "Manga", chapter: "Chapter", files: Iterator[tuple[str, str, bool]], extension: str = "zip") -> str:
 		"""Система сборки: *.ZIP-архив."""
 
+		OutputPath = f"{self.__GetOutputPath(title, chapter)}.{extension}"
+		PartPath = f"{OutputPath}.part"
+		Directory = os.path.dirname(OutputPath)
+		if Directory and not os.path.exists(Directory): os.makedirs(Directory)
+
+		try:
+			with zipfile.ZipFile(PartPath, "w") as Archive:
+
+				for Filename, FilePath, IsTemporary in files:
+					Compression = zipfile.ZIP_STORED if os.path.splitext(Filename)[1].lower() in COMPRESSED_IMAGES_TYPES else zipfile.ZIP_DEFLATED
+					Archive.write(FilePath, Filename, compress_type = Compression)
+					if IsTemporary: os.remove(FilePath)
+
+		except:
+			if os.path.exists(PartPath): os.remove(PartPath)
+			raise
+
+		os.replace(PartPath, OutputPath)
+
+		return OutputPath
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __DownloadSlide(self, title: "Manga", chapter: "Chapter", slide: dict) -> ImageDownloadingStatus:
+		"""
+		Получает слайд. Сначала слайд ищется в локальном хранилище изображений и только при отсутствии скачивается во временный каталог парсера. Скачанный слайд сохраняется в хранилище, если это включено опцией `store_slides`.
+
+		:param title: Данные тайтла.
+		:type title: Manga
+		:param chapter: Данные главы.
+		:type chapter: Chapter
+		:param slide: Данные слайда.
+		:type slide: dict
+		:return: Статус получения изображения. В случае успеха значение содержит путь к файлу, а под ключом `temporary` указано, находится ли файл во временном каталоге.
+		:rtype: ImageDownloadingStatus
+		"""
+
+		LocalPath = self.__GetLocalSlidePath(title, chapter, slide)
+
+		if os.path.exists(LocalPath) and not self._SystemObjects.FORCE_MODE:
+			Status = ImageDownloadingStatus()
+			Status.set_is_exists(True)
+			Status.value = LocalPath
+			Status["temporary"] = False
+			Status.push_message("Found locally.")
+
+			return Status
+
+		Parser: "MangaParser" = title.parser
+		Status = Parser.source_operator.image(slide["link"])
+		Status["temporary"] = True
+
+		if Status.value:
+			Status.value = f"{self._Temper.parser_temp}/{Status.value}"
+			ImagesStore = Parser.images_downloader.images_store
+
+			if not self._ParserSettings.common.store_slides or getattr(Status, "is_replaced_by_stub", False): pass
+
+			else:
+				os.makedirs(os.path.dirname(LocalPath), exist_ok = True)
+				if ImagesStore: ImagesStore.store(Status.value, LocalPath, move = False)
+				else: self.__LinkFile(Status.value, LocalPath)
+
+		return Status
+
+	def __DownloadSlides(self, title: "Manga", chapter: "Chapter") -> Iterator[tuple[str, str, bool]]:
+		"""
+		Получает слайды главы и по мере готовности в порядке следования возвращает имя файла в сборке, путь к файлу и состояние: является ли файл временным.
+
+		:param title: Данные тайтла.
+		:type title: Manga
+		:param chapter: Данные главы.
+		:type chapter: Chapter
+		:return: Генератор из имени файла в сборке, пути к файлу и состояния временности файла.
+		:rtype: Iterator[tuple[str, str, bool]]
+		"""
+
+		Slides = chapter.slides
+		WorkersCount = self.__WorkersCount
+		Filenames = [self.__GetSlideFilename(Slide) for Slide in Slides]
+		if len(set(Filenames)) != len(Filenames): WorkersCount = 1
+
+		Executor = ThreadPoolExecutor(max_workers = WorkersCount) if WorkersCount > 1 and len(Slides) > 1 else None
+		Futures = [Executor.submit(self.__DownloadSlide, title, chapter, Slide) for Slide in Slides] if Executor else list()
+		DownloadedSlidesCount = 0
+
+		try:
+
+			for SlideIndex in range(len(Slides)):
+				Slide = Slides[SlideIndex]
+				Filename = Filenames[SlideIndex]
+				if not Executor: print(f"[{Slide['index']} / {len(Slides)}] Downloading \"{Filename}\"… ", flush = True, end = "")
+				DownloadingStatus = Futures[SlideIndex].result() if Executor else self.__DownloadSlide(title, chapter, Slide)
+
+				if not DownloadingStatus.has_errors:
+					DownloadedSlidesCount += 1
+					self._SystemObjects.logger.info(f"Slide \"{Filename}\" downloaded.", stdout = False)
+
+				if Executor:
+					print(f"\rDownloading slides: {SlideIndex + 1} / {len(Slides)}… ", flush = True, end = "")
+					if SlideIndex == len(Slides) - 1: print("Done.")
+
+				else:
+					DownloadingStatus.print_messages()
+					if not DownloadingStatus.has_errors: print("Done.")
+
+				if DownloadingStatus.has_errors: self._Logger.error(f"Unable download slide \"{Filename}\". Response code: {DownloadingStatus.code}.")
+				if DownloadingStatus.value: yield f"{Slide['index']}{Path(DownloadingStatus.value).suffix}", DownloadingStatus.value, DownloadingStatus["temporary"]
+
+		finally:
+			if Executor: Executor.shutdown(cancel_futures = True)
+
+		if Executor: self._SystemObjects.logger.info(f"Slides downloaded: {DownloadedSlidesCount} / {len(Slides)}.")
+
+	def __GetLocalSlidePath(self, title: "Manga", chapter: "Chapter", slide: dict) -> str:
+		"""
+		Генерирует путь к слайду в локальном хранилище изображений. Имя файла определяется хэшем ссылки. Каталоги при этом не создаются.
+
+		:param title: Данные тайтла.
+		:type title: Manga
+		:param chapter: Данные главы.
+		:type chapter: Chapter
+		:param slide: Данные слайда.
+		:type slide: dict
+		:return: Путь к слайду в локальном хранилище.
+		:rtype: str
+		"""
+
+		Link: str = slide["link"]
+		Directory = f"{self._ParserSettings.common.images_directory}/{title.used_filename}/slides/{chapter.id}"
+		Filename = hashlib.md5(Link.encode()).hexdigest() + Path(Link.split("?")[0]).suffix
+
+		return f"{Directory}/{Filename}"
+
+	def __GetOutputPath(self, title: "Manga", chapter: "Chapter") -> str:
+		"""
+		Генерирует путь к результату сборки главы без расширения.
+
+		:param title: Данные тайтла.
+		:type title: Manga
+		:param chapter: Данные главы.
+		:type chapter: Chapter
+		:return: Путь к результату сборки.
+		:rtype: str
+		"""
+
 		ChapterName = self._GenerateChapterNameByTemplate(chapter)
 		Volume = ""
 		if self.__SortingByVolumes and chapter.volume: Volume = self._GenerateVolumeNameByTemplate(chapter)
 		OutputPath = f"{self._ParserSettings.common.archives_directory}/{title.used_filename}/{Volume}/{ChapterName}"
-		OutputPath = NormalizePath(OutputPath)
 
-		shutil.make_archive(OutputPath, "zip", directory)
+		return NormalizePath(OutputPath)
+
+	def __GetSlideFilename(self, slide: dict) -> str:
+		"""
+		Возвращает имя файла слайда на основе ссылки.
 
-		return OutputPath + ".zip"
+		:param slide: Данные слайда.
+		:type slide: dict
+		:return: Имя файла.
+		:rtype: str
+		"""
+
+		return slide["link"].split("/")[-1]
+
+	def __LinkFile(self, source: str, destination: str):
+		"""
+		Создаёт жёсткую ссылку на файл, а при невозможности копирует его.
+
+		:param source: Путь к исходному файлу.
+		:type source: str
+		:param destination: Путь к создаваемому файлу.
+		:type destination: str
+		"""
+
+		if os.path.exists(destination): os.remove(destination)
+
+		try: os.link(source, destination)
+		except OSError: shutil.copy2(source, destination)
 
 	#==========================================================================================#
 	# >>>>> ПЕРЕОПРЕДЕЛЯЕМЫЕ МЕТОДЫ <<<<< #
@@ -84,6 +256,7 @@ class MangaBuilder(BaseBuilder):
 		}
 
 		self.__SortingByVolumes = False
+		self.__WorkersCount = 1
 
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
@@ -102,31 +275,7 @@ class MangaBuilder(BaseBuilder):
 		if not self._BuildSystem: self._BuildSystem = MangaBuildSystems.Simple
 
 		TargetChapter: "Chapter" = self._FindChapter(title.branches, chapter_id)
-		SlidesCount = len(TargetChapter.slides)
-		WorkDirectory = f"{self._Temper.builder_temp}/{title.used_filename}"
-
-		for Slide in TargetChapter.slides:
-			Link: str = Slide["link"]
-			Filename: str = Link.split("/")[-1]
-			Index: int = Slide["index"]
-			
-			if not os.path.exists(WorkDirectory): os.mkdir(WorkDirectory)
-			Parser: "MangaParser" = title.parser
-			print(f"[{Index} / {SlidesCount}] Downloading \"{Filename}\"… ", flush = True, end = "")
-			DownloadingStatus = Parser.source_operator.image(Link)
-			DownloadingStatus.print_messages()
-
-			if not DownloadingStatus.has_errors:
-				print("Done.")
-				self._SystemObjects.logger.info(f"Slide \"{Filename}\" downloaded.", stdout = False)
-
-			else: self._Logger.error(f"Unable download slide \"{Filename}\". Response code: {DownloadingStatus.code}.")
-
-			MovingStatus = self._Parser.images_downloader.move_from_temp(WorkDirectory, Filename, f"{Index}", is_full_filename = False)
-			MovingStatus.print_messages()
-			self.__BuildSystemsMethods[self._BuildSystem](title, TargetChapter, WorkDirectory)
-
-		shutil.rmtree(WorkDirectory)
+		self.__BuildSystemsMethods[self._BuildSystem](title, TargetChapter, self.__DownloadSlides(title, TargetChapter))
 
 	def build_branch(self, title: "Manga", branch_id: int | None = None):
 		"""
@@ -138,6 +287,16 @@ class MangaBuilder(BaseBuilder):
 		self._SystemObjects.logger.info(f"Building branch {TargetBranch.id}…")
 		for CurrentChapter in TargetBranch.chapters: self.build_chapter(title, CurrentChapter.id)
 
+	def set_workers_count(self, count: int):
+		"""
+		Задаёт количество слайдов, скачиваемых одновременно.
+
+		:param count: Количество потоков скачивания.
+		:type count: int
+		"""
+
+		self.__WorkersCount = max(int(count), 1)
+
 	def select_build_system(self, build_system: str | None):
 		"""
 		Задаёт систему сборки контента.
@@ -1,13 +1,13 @@
 from .Formats.Components.Enums import ContentTypes
 from .SourceOperator import BaseSourceOperator
 
+from Source.Core.Base.Formats.Components.Functions import ReadTitleHeader
 from Source.Core.Base.Formats.Ranobe import Ranobe
 from Source.Core.Base.Formats.Manga import Manga
 from Source.Core import Exceptions
 
-from dublib.Methods.Filesystem import ReadJSON
-
 from types import MappingProxyType
+from threading import RLock
 from typing import TYPE_CHECKING
 import importlib
 
@@ -49,11 +49,15 @@ class BaseEntryPoint:
 
 	@property
 	def source_operator(self) -> BaseSourceOperator:
-		"""Базовый оператор источника."""
+		"""Базовый оператор источника. Создаётся при первом обращении, в том числе из нескольких потоков одновременно."""
 
 		if not self._SourceOperator:
-			Module = importlib.import_module(f"Parsers.{self._Manifest.name}.main")
-			self._SourceOperator = Module.SourceOperator(self)
+
+			with self._SourceOperatorLocker:
+
+				if not self._SourceOperator:
+					Module = importlib.import_module(f"Parsers.{self._Manifest.name}.main")
+					self._SourceOperator = Module.SourceOperator(self)
 
 		return self._SourceOperator
 
@@ -92,6 +96,7 @@ class BaseEntryPoint:
 		self._Manifest = manifest
 
 		self._SourceOperator: BaseSourceOperator | None = None
+		self._SourceOperatorLocker = RLock()
 		self._ContentStructs = MappingProxyType({
 			ContentTypes.Manga: Manga,
 			ContentTypes.Ranobe: Ranobe
@@ -118,7 +123,7 @@ class BaseEntryPoint:
 
 	def get_content_type_by_file(self, filename: str) -> ContentTypes:
 		"""
-		Определяет тип контента по JSON файлу.
+		Определяет тип контента по JSON файлу. При включённом кэшировании формат берётся из каталога описательных файлов, иначе считывается только заголовок файла.
 
 		:param filename: Имя файла в выходном каталоге парсера.
 		:type filename: str
@@ -126,8 +131,14 @@ class BaseEntryPoint:
 		:rtype: ContentTypes
 		"""
 
-		Path = f"{self.settings.directories.titles}/{filename}.json"
-		Data = ReadJSON(Path)
+		Directory = self.settings.directories.titles
+
+		if self._SystemObjects.CACHING:
+			Data = self._SystemObjects.temper.shared_data.catalog.get_record(Directory, filename)
+			if not Data: raise FileNotFoundError(f"{Directory}/{filename}.json")
+
+		else: Data = ReadTitleHeader(f"{Directory}/{filename}.json", ("format",))
+
 		ContentType = Data.get("format").split("-")[-1]
 
 		return ContentTypes(ContentType)
@@ -87,7 +87,7 @@ class BaseExtension:
 		"""
 		Инициализирует оператор WEB-запросов.
 
-		:return: Оператор запросов или `None` для использования стандартного запросчика из парсера.
+		:return: Оператор запросов или `None` для использования стандартного запросчика из парсера. Созданный оператор регистрируется в менеджере сессий и переиспользуется при повторной инициализации расширения.
 		:rtype: WebRequestor | None
 		"""
 
@@ -132,7 +132,13 @@ class BaseExtension:
 		self._Settings = self._SystemObjects.controller.current_extension_settings
 		self._Requestor = self._Parser.requestor
 
-		BufferedRequestor = self._InitializeRequestor()
+		Owner = f"{self._ParserManifest.name}/{self._SystemObjects.extension_name}"
+		BufferedRequestor = self._SystemObjects.sessions.get_requestor(Owner)
+
+		if not BufferedRequestor:
+			BufferedRequestor = self._InitializeRequestor()
+			if BufferedRequestor: BufferedRequestor = self._SystemObjects.sessions.register(Owner, BufferedRequestor, self._ParserSettings.common.pool_size)
+
 		if BufferedRequestor: self._Requestor = BufferedRequestor
 
 		self._PostInitMethod()
@@ -1,5 +1,5 @@
 from .Components.WordsDictionary import CheckLanguageCode, GetDictionaryPreset, WordsDictionary
-from .Components.Functions import SafelyReadTitleJSON
+from .Components.Functions import GetTitleFileCompression, IsShardedTitle, ReadTitleJSON, ReadTitleShard, RemoveTitleShards, SafelyReadTitleJSON, SerializeTitleJSON, WriteShardedTitle, WriteTitleJSON
 from .Components.Structs import ChapterSearchResult
 from .Components.Enums import *
 
@@ -7,13 +7,15 @@ from Source.Core.Base.Parsers.Components.ImagesDownloader import ImageDownloadin
 from Source.Core import Exceptions
 
 from dublib.Methods.Data import RemoveRecurringSubstrings, Zerotify
-from dublib.Methods.Filesystem import ReadJSON, WriteJSON
 
-from typing import Any, Iterable, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+from functools import partial
 from pathlib import Path
 from os import PathLike
-from time import sleep
 import hashlib
+import sqlite3
+import shutil
 import os
 
 import validators
@@ -565,11 +567,15 @@ class BaseBranch:
 	def chapters(self) -> tuple[BaseChapter]:
 		"""Последовательность глав."""
 
-		return tuple(self._Chapters)
+		self.load()
+
+		return tuple(self._MaterializeChapter(ID) for ID in tuple(self._Chapters.keys()))
 
 	@property
 	def chapters_count(self) -> int:
-		"""Количество глав."""
+		"""Количество глав. Для ветви с отложенной загрузкой берётся из метаданных без чтения глав."""
+
+		if self._Loader: return self._DeferredChaptersCount
 
 		return len(self._Chapters)
 
@@ -577,9 +583,14 @@ class BaseBranch:
 	def empty_chapters_count(self) -> int:
 		"""Количество глав без контента."""
 
+		self.load()
 		EmptyChaptersCount = 0
 
-		for CurrentChapter in self._Chapters:
+		for CurrentChapter in self._Chapters.values():
+
+			if type(CurrentChapter) == dict:
+				if not CurrentChapter.get("slides") and not CurrentChapter.get("paragraphs"): EmptyChaptersCount += 1
+				continue
 
 			try:
 				if not CurrentChapter.slides: EmptyChaptersCount += 1
@@ -594,6 +605,12 @@ class BaseBranch:
 		"""Уникальный идентификатор ветви."""
 
 		return self._ID
+
+	@property
+	def is_loaded(self) -> bool:
+		"""Состояние: загружены ли главы ветви."""
+
+		return self._Loader == None
 	
 	#==========================================================================================#
 	# >>>>> МЕТОДЫ <<<<< #
@@ -608,7 +625,63 @@ class BaseBranch:
 		"""
 
 		self._ID = id
-		self._Chapters: list[BaseChapter] = list()
+		self._Chapters: dict[int, BaseChapter | dict] = dict()
+		self._ChapterFactory: Callable[[dict], BaseChapter] | None = None
+		self._Owner: "BaseTitle | None" = None
+		self._Loader: Callable[[], None] | None = None
+		self._DeferredChaptersCount = 0
+
+	def _AddRawChapters(self, chapters: Iterable[dict], factory: Callable[[dict], BaseChapter]):
+		"""
+		Добавляет главы в виде словарей данных. Объекты глав создаются фабрикой только при первом обращении к ним.
+
+		:param chapters: Последовательность словарей данных глав.
+		:type chapters: Iterable[dict]
+		:param factory: Функция, создающая объект главы из словаря.
+		:type factory: Callable[[dict], BaseChapter]
+		:raises ParsingError: Выбрасывается при отсутствии у добавляемой главы ID.
+		"""
+
+		self._ChapterFactory = factory
+
+		for CurrentChapter in chapters:
+			ChapterID = CurrentChapter.get("id")
+			if ChapterID == None: raise Exceptions.ParsingError("Chapter must have unique ID.")
+			if ChapterID in self._Chapters: continue
+			self._Chapters[ChapterID] = CurrentChapter
+			if self._Owner: self._Owner._IndexChapter(self, ChapterID)
+
+	def _MaterializeChapter(self, id: int) -> BaseChapter:
+		"""
+		Возвращает объект главы, при необходимости создавая его из словаря данных.
+
+		:param id: ID главы.
+		:type id: int
+		:raises KeyError: Выбрасывается при отсутствии главы в ветви.
+		:return: Глава.
+		:rtype: BaseChapter
+		"""
+
+		CurrentChapter = self._Chapters[id]
+
+		if type(CurrentChapter) == dict:
+			CurrentChapter = self._ChapterFactory(CurrentChapter)
+			self._Chapters[id] = CurrentChapter
+
+		return CurrentChapter
+
+	def _SetLoader(self, loader: Callable[[], None], chapters_count: int):
+		"""
+		Откладывает загрузку глав ветви до первого обращения к ним.
+
+		:param loader: Функция, наполняющая ветвь главами.
+		:type loader: Callable[[], None]
+		:param chapters_count: Известное из метаданных количество глав.
+		:type chapters_count: int
+		"""
+
+		self._Loader = loader
+		self._DeferredChaptersCount = chapters_count
 
 	def add_chapter(self, chapter: BaseChapter):
 		"""
@@ -620,8 +693,10 @@ class BaseBranch:
 		"""
 
 		if chapter.id == None: raise Exceptions.ParsingError("Chapter must have unique ID.")
-		if chapter.id in tuple(Value.id for Value in self._Chapters): return
-		self._Chapters.append(chapter)
+		self.load()
+		if chapter.id in self._Chapters: return
+		self._Chapters[chapter.id] = chapter
+		if self._Owner: self._Owner._IndexChapter(self, chapter.id)
 
 	def get_chapter_by_id(self, id: int) -> BaseChapter:
 		"""
@@ -634,14 +709,17 @@ class BaseBranch:
 		:rtype: BaseChapter
 		"""
 
-		Data = None
+		self.load()
 
-		for CurrentChapter in self._Chapters:
-			if CurrentChapter.id == id: Data = CurrentChapter
+		return self._MaterializeChapter(id)
 
-		if not Data: raise KeyError(id)
+	def load(self):
+		"""Загружает главы ветви, если их загрузка была отложена."""
 
-		return CurrentChapter
+		if not self._Loader: return
+		Loader = self._Loader
+		self._Loader = None
+		Loader()
 	
 	def remove_chapter(self, id: int):
 		"""
@@ -652,8 +730,9 @@ class BaseBranch:
 		:raises KeyError: ВЫбрасывается при отсутствии главы в ветви.
 		"""
 		
-		TargetChapter = self.get_chapter_by_id(id)
-		self._Chapters.remove(TargetChapter)
+		self.load()
+		del self._Chapters[id]
+		if self._Owner: self._Owner._UnindexChapter(self, id)
 
 	def replace_chapter_by_id(self, chapter: BaseChapter, id: int):
 		"""
@@ -666,20 +745,54 @@ class BaseBranch:
 		:raises KeyError: Выбрасывается при отсутствии заменяемой главы в ветви.
 		"""
 
-		IsSuccess = False
+		self.load()
+		if id not in self._Chapters: raise KeyError(id)
 
-		for Index in range(len(self._Chapters)):
+		if chapter.id == id: self._Chapters[id] = chapter
+
+		else:
+			Chapters = dict()
 
-			if self._Chapters[Index].id == id:
-				self._Chapters[Index] = chapter
-				IsSuccess = True
+			for Key, Value in self._Chapters.items():
+				if Key == id: Chapters[chapter.id] = chapter
+				else: Chapters[Key] = Value
 
-		if not IsSuccess: raise KeyError(id)
+			self._Chapters = Chapters
+
+		if self._Owner:
+			self._Owner._UnindexChapter(self, id)
+			self._Owner._IndexChapter(self, chapter.id)
 	
+	def replace_chapters(self, chapters: Iterable[BaseChapter]):
+		"""
+		Заменяет состав глав ветви с сохранением порядка переданной последовательности и обновляет индекс глав тайтла. Главы с повторяющимся ID игнорируются.
+
+		:param chapters: Новая последовательность глав.
+		:type chapters: Iterable[BaseChapter]
+		:raises ParsingError: Выбрасывается при отсутствии у главы ID.
+		"""
+
+		self.load()
+		PreviousIDs = tuple(self._Chapters.keys())
+		Chapters = dict()
+
+		for CurrentChapter in chapters:
+			if CurrentChapter.id == None: raise Exceptions.ParsingError("Chapter must have unique ID.")
+			if CurrentChapter.id not in Chapters: Chapters[CurrentChapter.id] = CurrentChapter
+
+		self._Chapters = Chapters
+		if not self._Owner: return
+
+		for ChapterID in PreviousIDs:
+			if ChapterID not in Chapters: self._Owner._UnindexChapter(self, ChapterID)
+
+		for ChapterID in Chapters: self._Owner._IndexChapter(self, ChapterID)
+
 	def reverse(self):
 		"""Инвертирует порядок глав в ветви."""
 
-		self._Chapters = list(reversed(self._Chapters))
+		self.load()
+		self._Chapters = dict(reversed(self._Chapters.items()))
 
 	def sort(self):
 		"""
@@ -688,19 +801,21 @@ class BaseBranch:
 		Переопределите данный метод для использования иных алгоритмов сортировки.
 		"""
 
-		self._Chapters = list(sorted(
-			self._Chapters,
+		Chapters = sorted(
+			self.chapters,
 			key = lambda Value: (
 				list(map(int, Value.volume.split(".") if Value.volume else "")),
 				list(map(int, Value.number.split(".") if Value.number else ""))
 			)
-		))
+		)
+		self._Chapters = {Value.id: Value for Value in Chapters}
 
 	def to_list(self) -> list[dict]:
 		"""Возвращает список словарей данных глав, принадлежащих текущей ветви."""
 
+		self.load()
 		BranchList = list()
-		for CurrentChapter in self._Chapters: BranchList.append(CurrentChapter.to_dict())
+		for CurrentChapter in self._Chapters.values(): BranchList.append(CurrentChapter if type(CurrentChapter) == dict else CurrentChapter.to_dict())
 
 		return BranchList
 	
@@ -867,12 +982,31 @@ class BaseTitle:
 	def branches(self) -> tuple[BaseBranch]:
 		"""Последовательность ветвей тайтла."""
 
+		self._SortBranches()
+
 		return self._Branches
 	
 	#==========================================================================================#
 	# >>>>> НАСЛЕДУЕМЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
+	def _AmendChapter(self, branch: "BaseBranch", chapter: "BaseChapter") -> bool | None:
+		"""
+		Дополняет главу контентом при помощи парсера.
+
+		:param branch: Данные ветви.
+		:type branch: BaseBranch
+		:param chapter: Данные главы.
+		:type chapter: BaseChapter
+		:return: Возвращает `True`, если глава получила контент, `False` – если осталась пустой, и `None`, если глава не найдена в источнике.
+		:rtype: bool | None
+		"""
+
+		try: self._Parser.amend(branch, chapter)
+		except Exceptions.ChapterNotFound: return
+
+		return bool(self._GetChapterContent(chapter))
+
 	def _CalculateEmptyChapters(self) -> int:
 		"""Подсчитывает количество глав без контента во всех ветвях."""
 
@@ -885,10 +1019,10 @@ class BaseTitle:
 		"""Скачивает обложки."""
 
 		DownloadedCoversCount = 0
+		Results = self._Parser.images_downloader.batch(lambda CurrentCover: CurrentCover.download(), self._Covers)
 
-		for CurrentCover in self._Covers:
+		for CurrentCover, Result in zip(self._Covers, Results):
 			print(f"Downloading cover: \"{CurrentCover.filename}\"… ", end = "", flush = True)
-			Result = CurrentCover.download()
 			if Result: DownloadedCoversCount += 1
 			Result.print_messages()
 
@@ -899,72 +1033,171 @@ class BaseTitle:
 
 		if self._Persons: PersonsDirectory = self._ParserSettings.directories.get_persons(self._UsedFilename)
 		DownloadedImagesCount = 0
-		PersonsCount = len(self._Persons)
+		Queue: dict[str, list[tuple[str, bool]]] = dict()
 
-		for PersonIndex in range(PersonsCount):
+		for CurrentPerson in self._Persons:
 
-			for ImageData in self._Persons[PersonIndex].images:
+			for ImageData in CurrentPerson.images:
 				Link = ImageData["link"]
 				Filename = ImageData["filename"]
 				IsExists = self._Parser.images_downloader.is_exists(Link, PersonsDirectory, Filename)
-				print(f"Downloading person image: \"{Filename}\"… ", end = "", flush = True)
 				
-				if IsExists and not self._SystemObjects.FORCE_MODE:
-					print("Already exists.")
-					continue
+				if IsExists and not self._SystemObjects.FORCE_MODE: print(f"Downloading person image: \"{Filename}\"… Already exists.")
+				else: Queue.setdefault(Link, list()).append((Filename, IsExists))
 
-				Result = self._Parser.source_operator.image(Link)
-			
-				if Result.code == 200:
+		Links = tuple(Queue.keys())
+
+		for Link, Result in zip(Links, self._Parser.source_operator.images(Links)):
+			SourcePath = None
+
+			for Filename, IsExists in Queue[Link]:
+				print(f"Downloading person image: \"{Filename}\"… ", end = "", flush = True)
+				if Result.code != 200: continue
+				TargetPath = f"{PersonsDirectory}/{Filename}"
+
+				if not SourcePath:
 					self._Parser.images_downloader.move_from_temp(PersonsDirectory, Result.value, Filename)
-					if IsExists: print("Overwritten.")
-					else: print("Done.")
-					DownloadedImagesCount += 1
+					SourcePath = TargetPath
+
+				elif not os.path.exists(TargetPath):
 
-				if PersonIndex < PersonsCount - 1: sleep(self._ParserSettings.common.delay)
+					try: os.link(SourcePath, TargetPath)
+					except OSError: shutil.copy2(SourcePath, TargetPath)
+
+				if IsExists: print("Overwritten.")
+				else: print("Done.")
+				DownloadedImagesCount += 1
 
 		self._SystemObjects.logger.info(f"Presons images downloaded: {DownloadedImagesCount}.")
 
 	def _FindChapterByID(self, chapter_id: int) -> ChapterSearchResult | None:
 		"""
-		Возвращает данные ветви и главы для указанного ID.
+		Возвращает данные ветви и главы для указанного ID. Ветви с отложенной загрузкой предварительно загружаются.
 			chapter_id – уникальный идентификатор главы.
 		"""
 
-		BranchResult = None
-		ChapterResult = None
+		if not all(CurrentBranch.is_loaded for CurrentBranch in self._Branches):
+			for CurrentBranch in self._Branches: CurrentBranch.load()
+			self._RebuildChaptersIndex()
 
-		for CurrentBranch in self._Branches:
+		Branch = self._ChaptersIndex.get(chapter_id)
+		if not Branch: return
 
-			for CurrentChapter in CurrentBranch.chapters:
+		return ChapterSearchResult(Branch, Branch.get_chapter_by_id(chapter_id))
+	
+	def _GetChapterContent(self, chapter: "BaseChapter") -> list:
+		"""
+		Возвращает контент главы в зависимости от формата тайтла.
 
-				if CurrentChapter.id == chapter_id:
-					BranchResult = CurrentBranch
-					ChapterResult = CurrentChapter
-					break
+		:param chapter: Данные главы.
+		:type chapter: BaseChapter
+		:return: Список слайдов или абзацев.
+		:rtype: list
+		"""
 
-		Result = ChapterSearchResult(BranchResult, ChapterResult) if ChapterResult else None
+		if self.format == "melon-manga": return chapter.slides
+		elif self.format == "melon-ranobe": return chapter.paragraphs
 
-		return Result
-	
-	def _IsLocalFileEqual(self) -> bool:
+		return list()
+
+	def _IndexChapter(self, branch: BaseBranch, chapter_id: int):
+		"""
+		Заносит главу в индекс глав тайтла.
+
+		:param branch: Ветвь, которой принадлежит глава.
+		:type branch: BaseBranch
+		:param chapter_id: ID главы.
+		:type chapter_id: int
+		"""
+
+		self._ChaptersIndex[chapter_id] = branch
+
+	def _GetDataHash(self, data: dict | bytes) -> str:
+		"""
+		Вычисляет хэш канонической сериализации данных тайтла.
+
+		:param data: Словарь данных тайтла или его сериализованное представление.
+		:type data: dict | bytes
+		:return: Хэш SHA-256 в шестнадцатеричном представлении.
+		:rtype: str
+		"""
+
+		if isinstance(data, dict): data = SerializeTitleJSON(data)
+
+		return hashlib.sha256(data).hexdigest()
+
+	def _GetLocalFileSignature(self) -> tuple[int, int] | None:
 		"""
-		Проверяет, идентичны ли данные тайтла локальным данным.
+		Возвращает подпись локального файла тайтла, по которой определяется его изменение.
 
+		:return: Время модификации в наносекундах и размер файла или `None` при отсутствии файла.
+		:rtype: tuple[int, int] | None
+		"""
+
+		try: Stat = os.stat(self._TitlePath)
+		except OSError: return None
+
+		return Stat.st_mtime_ns, Stat.st_size
+
+	def _IsLocalFileEqual(self, data_hash: str) -> bool:
+		"""
+		Проверяет, идентичны ли данные тайтла локальным данным. Если локальный файл не изменялся с момента запоминания его состояния и хэш этого состояния известен, файл не считывается.
+
+		:param data_hash: Хэш текущих данных тайтла.
+		:type data_hash: str
 		:return: Возвращает `True`, если данные идентичны, или `False` в противном случа и при отсутствии локального файла.
 		:rtype: bool
 		"""
 
-		if not os.path.exists(self._TitlePath): return False
+		Signature = self._GetLocalFileSignature()
+		if not Signature: return False
+
+		if self._LocalState and self._LocalState[2] and self._LocalState[:2] == (self._TitlePath, Signature): return self._LocalState[2] == data_hash
+		LocalHash = self._GetDataHash(ReadTitleJSON(self._TitlePath))
+		self._LocalState = (self._TitlePath, Signature, LocalHash)
 
-		LocalHasher = hashlib.sha256(str(ReadJSON(self._TitlePath)).encode())
-		MemoryHasher = hashlib.sha256(str(self._Title).encode())
+		return LocalHash == data_hash
 
-		return LocalHasher.hexdigest() == MemoryHasher.hexdigest()
+	def _LoadBranchShard(self, branch: BaseBranch):
+		"""
+		Наполняет ветвь главами из её шарда.
+
+		:param branch: Ветвь с отложенной загрузкой.
+		:type branch: BaseBranch
+		"""
+
+		branch._AddRawChapters(ReadTitleShard(self._TitlePath, branch.id), self._CreateChapter)
+
+	def _RebuildChaptersIndex(self):
+		"""Перестраивает индекс глав тайтла по текущему набору ветвей. При повторении ID главы приоритет имеет последняя ветвь. Главы ветвей с отложенной загрузкой индексируются при их загрузке."""
+
+		self._ChaptersIndex = dict()
+
+		for CurrentBranch in self._Branches:
+			CurrentBranch._Owner = self
+			if not CurrentBranch.is_loaded: continue
+			for ChapterID in CurrentBranch._Chapters: self._IndexChapter(CurrentBranch, ChapterID)
+
+	def _RememberLocalState(self, data_hash: str | None = None):
+		"""
+		Запоминает состояние локального файла тайтла для последующего сравнения при сохранении. Если хэш данных не передан, он будет вычислен только при сохранении.
+
+		:param data_hash: Хэш данных локального файла.
+		:type data_hash: str | None
+		"""
+
+		self._LocalState = (self._TitlePath, self._GetLocalFileSignature(), data_hash)
+
+	def _SortBranches(self):
+		"""Упорядочивает ветви по убыванию количества глав, если со времени последней сортировки были добавлены ветви."""
+
+		if self._IsBranchesSorted: return
+		self._Branches.sort(key = lambda Value: Value.chapters_count, reverse = True)
+		self._IsBranchesSorted = True
 
 	def _SearchFileInDirectory(self, directory: PathLike, identificator: str, type: By) -> dict | None:
 		"""
-		Находит файл JSON в директории по идентификатору определённого типа.
+		Находит файл JSON в директории по идентификатору определённого типа. При включённом кэшировании поиск выполняется по каталогу описательных файлов: найденная запись проверяется по времени модификации файла, а полное обновление каталога выполняется только для устаревших записей и при промахе, но в последнем случае не более одного раза за запуск.
 
 		:param directory: Путь к каталогу файлов.
 		:type directory: PathLike
@@ -976,6 +1209,24 @@ class BaseTitle:
 		:rtype: dict | None
 		"""
 
+		if self._SystemObjects.CACHING:
+			Catalog = self._SystemObjects.temper.shared_data.catalog
+			Search = Catalog.get_filename_by_id if type == By.ID else Catalog.get_filename_by_slug
+
+			try:
+				Filename = Search(identificator)
+				Record = Catalog.get_record(directory, Filename) if Filename else None
+
+				if not Record or str(Record[type.value]) != str(identificator):
+					Catalog.refresh(directory, lazy = not Filename)
+					Filename = Search(identificator)
+
+			except (sqlite3.Error, OSError) as ExceptionData: self._SystemObjects.logger.warning(f"Titles catalog unavailable: \"{ExceptionData}\". Scanning directory.")
+
+			else:
+				try: return SafelyReadTitleJSON(f"{directory}/{Filename}.json") if Filename else None
+				except (OSError, ValueError, Exceptions.UnsupportedFormat): return
+
 		for Element in os.scandir(directory):
 			if not Element.is_file() or not Element.name.endswith(".json"): continue
 
@@ -996,6 +1247,22 @@ class BaseTitle:
 		self._UsedFilename = filename
 		self._TitlePath = f"{self._ParserSettings.common.titles_directory}/{filename}.json"
 
+	def _UnindexChapter(self, branch: BaseBranch, chapter_id: int):
+		"""
+		Удаляет главу ветви из индекса глав тайтла. Если глава с таким же ID есть в другой ветви, индекс указывает на неё.
+
+		:param branch: Ветвь, которой принадлежала глава.
+		:type branch: BaseBranch
+		:param chapter_id: ID главы.
+		:type chapter_id: int
+		"""
+
+		if self._ChaptersIndex.get(chapter_id) is not branch: return
+		del self._ChaptersIndex[chapter_id]
+
+		for CurrentBranch in self._Branches:
+			if CurrentBranch is not branch and chapter_id in CurrentBranch._Chapters: self._IndexChapter(CurrentBranch, chapter_id)
+
 	#==========================================================================================#
 	# >>>>> НАСЛЕДУЕМЫЕ МЕТОДЫ ОБНОВЛЕНИЯ СЛОВАРНОЙ СТРУКТУРЫ <<<<< #
 	#==========================================================================================#
@@ -1017,6 +1284,8 @@ class BaseTitle:
 		:type sorting: bool
 		"""
 
+		self._SortBranches()
+
 		for CurrentBranch in self._Branches:
 			if brach_id and brach_id == CurrentBranch.id or not brach_id:
 				if sorting: CurrentBranch.sort()
@@ -1040,10 +1309,55 @@ class BaseTitle:
 	# >>>>> ПЕРЕОПРЕДЕЛЯЕМЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
+	def _CreateBranch(self, branch_id: int) -> BaseBranch:
+		"""
+		Создаёт пустую ветвь формата тайтла.
+
+		:param branch_id: ID ветви.
+		:type branch_id: int
+		:return: Ветвь.
+		:rtype: BaseBranch
+		"""
+
+		return BaseBranch(branch_id)
+
+	def _CreateChapter(self, data: dict) -> BaseChapter:
+		"""
+		Создаёт главу формата тайтла из словаря данных.
+
+		:param data: Словарь данных главы.
+		:type data: dict
+		:return: Глава.
+		:rtype: BaseChapter
+		"""
+
+		Chapter = BaseChapter(self._SystemObjects, self)
+		Chapter.set_dict(data)
+
+		return Chapter
+
 	def _ParseBranchesToObjects(self):
-		"""Преобразует данные ветвей в объекты."""
+		"""Преобразует данные ветвей в объекты. Объекты глав создаются при первом обращении к ним, а ветви, вынесенные в шарды, загружаются при первом обращении к их главам."""
 
-		pass
+		Branches = list()
+
+		for BranchID in self._Title["content"]:
+			BufferBranch = self._CreateBranch(int(BranchID))
+			BufferBranch._AddRawChapters(self._Title["content"][BranchID], self._CreateChapter)
+			Branches.append(BufferBranch)
+
+		if IsShardedTitle(self._Title):
+			ChaptersCounts = {Branch["id"]: Branch["chapters_count"] for Branch in self._Title["branches"]}
+
+			for BranchID in self._Title["shards"]:
+				BufferBranch = self._CreateBranch(int(BranchID))
+				BufferBranch._SetLoader(partial(self._LoadBranchShard, BufferBranch), ChaptersCounts.get(int(BranchID), 0))
+				Branches.append(BufferBranch)
+
+		self._Branches = Branches
+		self._BranchesIDs = set(CurrentBranch.id for CurrentBranch in Branches)
+		self._IsBranchesSorted = True
+		self._RebuildChaptersIndex()
 
 	def _PostInitMethod(self):
 		"""Метод, выполняющийся после инициализации объекта."""
@@ -1075,6 +1389,9 @@ class BaseTitle:
 
 		self._ParserSettings = self._SystemObjects.controller.current_parser_settings
 		self._Branches: list[BaseBranch] = list()
+		self._BranchesIDs: set[int] = set()
+		self._IsBranchesSorted = True
+		self._ChaptersIndex: dict[int, BaseBranch] = dict()
 		self._Persons: list[Person] = list()
 		self._Covers: list[Cover] = list()
 		self._Parser: "BaseParser" = None
@@ -1082,6 +1399,7 @@ class BaseTitle:
 		
 		self._UsedFilename = None
 		self._TitlePath = None
+		self._LocalState: tuple[PathLike, tuple[int, int] | None, str | None] | None = None
 		self._Title = {
 			"format": None,
 			"site": None,
@@ -1117,37 +1435,37 @@ class BaseTitle:
 		"""Дополняет контент содержимым."""
 
 		AmendedChaptersCount = 0
-		ProgressIndex = 0
 
 		if not self._Branches:
 			self._SystemObjects.logger.info("No content for amending.")
 			return
 
+		Targets = list()
+
 		for CurrentBranch in self._Branches:
 
 			for CurrentChapter in CurrentBranch.chapters:
-				CurrentChapter: "MangaChapter | RanobeChapter"
-				ChapterContent = list()
+				if not self._GetChapterContent(CurrentChapter): Targets.append((CurrentBranch, CurrentChapter))
+
+		WorkersCount = self._ParserSettings.common.amending_workers if self._Parser.is_concurrent_amending else 1
+		Executor = ThreadPoolExecutor(max_workers = WorkersCount) if WorkersCount > 1 and len(Targets) > 1 else None
+		Results = Executor.map(lambda Target: self._AmendChapter(*Target), Targets) if Executor else map(lambda Target: self._AmendChapter(*Target), Targets)
 
-				if self.format == "melon-manga": ChapterContent = CurrentChapter.slides
-				elif self.format == "melon-ranobe": ChapterContent = CurrentChapter.paragraphs
+		try:
 
-				if not ChapterContent:
-					ProgressIndex += 1
-					
-					try: self._Parser.amend(CurrentBranch, CurrentChapter)
-					except Exceptions.ChapterNotFound: continue
+			for Target, IsAmended in zip(Targets, Results):
+				CurrentChapter = Target[1]
+				if IsAmended is None: continue
 
-					if self.format == "melon-manga": ChapterContent = CurrentChapter.slides
-					elif self.format == "melon-ranobe": ChapterContent = CurrentChapter.paragraphs
+				if IsAmended:
+					AmendedChaptersCount += 1
+					self._SystemObjects.logger.chapter_amended(CurrentChapter)
 
-					if ChapterContent:
-						AmendedChaptersCount += 1
-						self._SystemObjects.logger.chapter_amended(CurrentChapter)
-						sleep(self._ParserSettings.common.delay)
+				else:
+					self._SystemObjects.logger.warning(f"Chapter {CurrentChapter.id} is empty.")
 
-					else:
-						self._SystemObjects.logger.warning(f"Chapter {CurrentChapter.id} is empty.")
+		finally:
+			if Executor: Executor.shutdown(cancel_futures = True)
 
 		self._SystemObjects.logger.amending_end(AmendedChaptersCount)
 
@@ -1212,6 +1530,7 @@ class BaseTitle:
 		if Data:
 			self._Title = Data
 			self._SetUsedFilename(str(self.id) if self._ParserSettings.common.use_id_as_filename else self.slug)
+			self._RememberLocalState()
 
 		else: raise FileNotFoundError()
 
@@ -1253,7 +1572,7 @@ class BaseTitle:
 
 	def save(self, sorting: bool = False):
 		"""
-		Сохраняет данные тайтла в локальный файл JSON.
+		Сохраняет данные тайтла в локальный файл JSON. При включённом шардированном хранении главы каждой ветви записываются в отдельный шард, а при заданном алгоритме сжатия файлы сжимаются.
 
 		:param sorting: Указывает, нужно ли провести сортировку глав на основе их нумерации.
 		:type sorting: bool
@@ -1265,13 +1584,28 @@ class BaseTitle:
 		self._UpdateBranchesInfo()
 		self._UpdateContent(sorting = sorting)
 
-		if not self._IsLocalFileEqual():
-			WriteJSON(self._TitlePath, self._Title)
-			self._SystemObjects.logger.info("Saved.")
+		Compression = self._ParserSettings.common.compression
 
+		if self._ParserSettings.common.sharded_storage:
+			IsSaved = WriteShardedTitle(self._TitlePath, self._Title, Compression)
+			self._LocalState = None
+
+		else:
+			self._Title.pop("shards", None)
+			Content = SerializeTitleJSON(self._Title)
+			DataHash = self._GetDataHash(Content)
+			IsSaved = RemoveTitleShards(self._TitlePath) or GetTitleFileCompression(self._TitlePath) != Compression or not self._IsLocalFileEqual(DataHash)
+
+			if IsSaved:
+				WriteTitleJSON(self._TitlePath, Content, Compression)
+				self._RememberLocalState(DataHash)
+
+		if IsSaved: self._SystemObjects.logger.info("Saved.")
 		else: self._SystemObjects.logger.info("No changes. Saving skipped.")
 
-		if self._SystemObjects.CACHING and all((self.id, self.slug)): self._SystemObjects.temper.shared_data.journal.update(self.id, self.slug)
+		if self._SystemObjects.CACHING and all((self.id, self.slug)):
+			self._SystemObjects.temper.shared_data.journal.update(self.id, self.slug)
+			self._SystemObjects.temper.shared_data.catalog.update(self._TitlePath, self._Title)
 			
 	def set_parser(self, parser: "BaseParser"):
 		"""
@@ -1365,7 +1699,7 @@ class BaseTitle:
 
 	def add_branch(self, branch: BaseBranch):
 		"""
-		Добавляет ветвь. Одинаковые объекты или ветви с повторяющимся ID будут проигнорированы.
+		Добавляет ветвь. Одинаковые объекты или ветви с повторяющимся ID будут проигнорированы. Ветви упорядочиваются по количеству глав при первом обращении к ним.
 
 		:param branch: Ветвь контента.
 		:type branch: BaseBranch
@@ -1373,9 +1707,15 @@ class BaseTitle:
 		"""
 
 		if branch.id == None: raise Exceptions.ParsingError("Branch must have unique ID.")
-		if branch.id in tuple(Element.id for Element in self._Branches): return
+		if branch.id in self._BranchesIDs: return
 		self._Branches.append(branch)
-		self._Branches = sorted(self._Branches, key = lambda Value: Value.chapters_count, reverse = True)
+		self._BranchesIDs.add(branch.id)
+		self._IsBranchesSorted = False
+
+		branch._Owner = self
+
+		if branch.is_loaded:
+			for ChapterID in branch._Chapters: self._IndexChapter(branch, ChapterID)
 
 	def set_site(self, site: str):
 		"""
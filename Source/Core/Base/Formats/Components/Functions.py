@@ -1,6 +1,463 @@
 from Source.Core.Exceptions import UnsupportedFormat
 
-from dublib.Methods.Filesystem import ListDir, ReadJSON
+from dublib.Methods.Filesystem import ListDir
+
+from typing import Iterable
+from functools import cache
+from os import PathLike
+import codecs
+import shutil
+import json
+import gzip
+import os
+
+try: import orjson
+except ImportError: orjson = None
+
+try: import zstandard
+except ImportError: zstandard = None
+
+#==========================================================================================#
+# >>>>> КОДЕК JSON <<<<< #
+#==========================================================================================#
+
+JSON_BACKENDS = ("orjson", "json")
+_JSONBackend = "orjson" if orjson else "json"
+
+def SelectTitleJSONBackend(backend: str):
+	"""
+	Выбирает библиотеку для десериализации JSON тайтлов.
+
+	:param backend: Название библиотеки: _orjson_ или _json_ (стандартная библиотека).
+	:type backend: str
+	:raises ValueError: Выбрасывается при неизвестном или недоступном названии библиотеки.
+	"""
+
+	global _JSONBackend
+
+	if backend not in JSON_BACKENDS: raise ValueError(f"Unknown JSON backend: \"{backend}\".")
+	if backend == "orjson" and not orjson: raise ValueError("orjson is not installed.")
+	_JSONBackend = backend
+
+def DeserializeTitleJSON(data: bytes) -> dict:
+	"""
+	Десериализует JSON тайтла.
+
+	:param data: Бинарное представление JSON.
+	:type data: bytes
+	:raises JSONDecodeError: Ошибка десериализации JSON.
+	:return: Словарное представление JSON тайтла.
+	:rtype: dict
+	"""
+
+	if _JSONBackend == "orjson": return orjson.loads(data)
+
+	return json.loads(data)
+
+def SerializeTitleJSON(data: dict | list) -> bytes:
+	"""
+	Сериализует данные тайтла в форматированный JSON с отступами табуляцией, как и прочие файлы JSON Melon. Запись всегда выполняется стандартной библиотекой, чтобы формат файлов не зависел от установленных пакетов: _orjson_ поддерживает только отступы в два пробела.
+
+	:param data: Словарь данных тайтла или список глав ветви.
+	:type data: dict | list
+	:return: Бинарное представление JSON.
+	:rtype: bytes
+	"""
+
+	return json.dumps(data, ensure_ascii = False, indent = "\t", separators = (",", ": ")).encode()
+
+def ReadTitleJSON(path: PathLike) -> dict:
+	"""
+	Считывает файл JSON тайтла. Сжатые файлы распознаются по сигнатуре и распаковываются автоматически.
+
+	:param path: Путь к JSON файлу.
+	:type path: PathLike
+	:raises JSONDecodeError: Ошибка десериализации JSON.
+	:raises FileNotFoundError: Выбрасывается при отсутствии файла.
+	:return: Словарное представление JSON тайтла.
+	:rtype: dict
+	"""
+
+	with open(path, "rb") as FileReader: return DeserializeTitleJSON(DecompressTitleData(FileReader.read()))
+
+def WriteTitleJSON(path: PathLike, data: dict | list | bytes, compression: str | None = None):
+	"""
+	Записывает файл JSON тайтла.
+
+	:param path: Путь к JSON файлу.
+	:type path: PathLike
+	:param data: Словарь данных тайтла, список глав ветви или уже сериализованное представление.
+	:type data: dict | list | bytes
+	:param compression: Алгоритм сжатия: _gzip_, _zstd_ или `None` для записи без сжатия.
+	:type compression: str | None
+	"""
+
+	if not isinstance(data, bytes): data = SerializeTitleJSON(data)
+	with open(path, "wb") as FileWriter: FileWriter.write(CompressTitleData(data, compression))
+
+#==========================================================================================#
+# >>>>> ЧТЕНИЕ ЗАГОЛОВКА <<<<< #
+#==========================================================================================#
+
+TITLE_HEADER_KEYS = ("format", "id", "slug")
+_HeaderDecoder = json.JSONDecoder()
+_HeaderWhitespaces = " \t\n\r"
+
+def _SkipWhitespaces(buffer: str, position: int) -> int:
+	"""
+	Пропускает пробельные символы JSON.
+
+	:param buffer: Строка JSON.
+	:type buffer: str
+	:param position: Начальная позиция.
+	:type position: int
+	:return: Позиция первого непробельного символа или длина строки.
+	:rtype: int
+	"""
+
+	while position < len(buffer) and buffer[position] in _HeaderWhitespaces: position += 1
+
+	return position
+
+def ReadTitleHeader(path: PathLike, keys: tuple[str] = TITLE_HEADER_KEYS) -> dict:
+	"""
+	Потоково считывает ключи верхнего уровня из начала файла JSON тайтла и прекращает чтение, как только все они найдены. Поскольку `format`, `id` и `slug` записываются первыми, для их получения считывается лишь несколько килобайт файла независимо от его размера. Сжатые файлы распаковываются потоково.
+
+	:param path: Путь к JSON файлу.
+	:type path: PathLike
+	:param keys: Искомые ключи верхнего уровня.
+	:type keys: tuple[str]
+	:raises JSONDecodeError: Ошибка десериализации JSON.
+	:raises FileNotFoundError: Выбрасывается при отсутствии файла.
+	:return: Словарь найденных ключей. Отсутствующие в файле ключи не включаются.
+	:rtype: dict
+	"""
+
+	Result = dict()
+	Keys = set(keys)
+	Decoder = codecs.getincrementaldecoder("utf-8")()
+	Buffer = ""
+	Position = 0
+	ChunkSize = 4096
+	IsEOF = False
+
+	with open(path, "rb") as FileReader:
+		Signature = FileReader.read(4)
+		FileReader.seek(0)
+		Stream = FileReader
+
+		if Signature.startswith(_CompressionSignatures["gzip"]): Stream = gzip.GzipFile(fileobj = FileReader)
+
+		elif Signature.startswith(_CompressionSignatures["zstd"]):
+			if not zstandard: raise ValueError("Unable to decompress title: zstandard is not installed.")
+			Stream = zstandard.ZstdDecompressor().stream_reader(FileReader)
+
+		while Keys:
+			if not IsEOF:
+				Chunk = Stream.read(ChunkSize)
+				IsEOF = not Chunk
+				Buffer += Decoder.decode(Chunk, final = IsEOF)
+				ChunkSize = min(ChunkSize * 2, 1048576)
+
+			try:
+				if not Position:
+					Position = _SkipWhitespaces(Buffer, 0)
+					if Position == len(Buffer) and not IsEOF: continue
+					if Buffer[Position : Position + 1] != "{": raise json.JSONDecodeError("Expecting object", Buffer, Position)
+					Position += 1
+
+				while Keys:
+					Start = _SkipWhitespaces(Buffer, Position)
+					if Buffer[Start : Start + 1] == "}": return Result
+					if Buffer[Start : Start + 1] != "\"": raise json.JSONDecodeError("Expecting property name", Buffer, Start)
+					Key, Index = json.decoder.scanstring(Buffer, Start + 1)
+					Index = _SkipWhitespaces(Buffer, Index)
+					if Buffer[Index : Index + 1] != ":": raise json.JSONDecodeError("Expecting ':' delimiter", Buffer, Index)
+					Value, Index = _HeaderDecoder.raw_decode(Buffer, _SkipWhitespaces(Buffer, Index + 1))
+					Index = _SkipWhitespaces(Buffer, Index)
+
+					if Index == len(Buffer) and not IsEOF: raise json.JSONDecodeError("Unterminated value", Buffer, Index)
+					if Buffer[Index : Index + 1] == ",": Index += 1
+					elif Buffer[Index : Index + 1] != "}": raise json.JSONDecodeError("Expecting ',' delimiter", Buffer, Index)
+
+					if Key in Keys:
+						Result[Key] = Value
+						Keys.discard(Key)
+
+					Position = Index
+
+			except (json.JSONDecodeError, IndexError):
+				if IsEOF: raise
+				continue
+
+	return Result
+
+def _ReadTitleHeaderSafely(path: PathLike, keys: tuple[str]) -> dict | None:
+	"""
+	Считывает заголовок файла JSON тайтла, подавляя ошибки.
+
+	:param path: Путь к JSON файлу.
+	:type path: PathLike
+	:param keys: Искомые ключи верхнего уровня.
+	:type keys: tuple[str]
+	:return: Словарь найденных ключей или `None`, если файл не удалось прочитать.
+	:rtype: dict | None
+	"""
+
+	try: return ReadTitleHeader(path, keys)
+	except Exception: return None
+
+def ReadTitleHeaders(paths: Iterable[PathLike], keys: tuple[str] = TITLE_HEADER_KEYS) -> list[dict | None]:
+	"""
+	Считывает заголовки нескольких файлов JSON тайтлов.
+
+	:param paths: Последовательность путей к JSON файлам.
+	:type paths: Iterable[PathLike]
+	:param keys: Искомые ключи верхнего уровня.
+	:type keys: tuple[str]
+	:return: Список словарей найденных ключей, где `None` соответствует файлам, которые не удалось прочитать.
+	:rtype: list[dict | None]
+	"""
+
+	return [_ReadTitleHeaderSafely(Path, keys) for Path in paths]
+
+#==========================================================================================#
+# >>>>> СЖАТИЕ <<<<< #
+#==========================================================================================#
+
+TITLE_COMPRESSIONS = ("gzip", "zstd")
+_CompressionSignatures = {
+	"gzip": b"\x1f\x8b",
+	"zstd": b"\x28\xb5\x2f\xfd"
+}
+
+def IsCompressionAvailable(compression: str) -> bool:
+	"""
+	Проверяет, поддерживается ли алгоритм сжатия в текущем окружении.
+
+	:param compression: Алгоритм сжатия.
+	:type compression: str
+	:return: Возвращает `True`, если алгоритм известен и необходимые библиотеки установлены.
+	:rtype: bool
+	"""
+
+	if compression == "zstd": return zstandard != None
+
+	return compression in TITLE_COMPRESSIONS
+
+def CompressTitleData(data: bytes, compression: str | None) -> bytes:
+	"""
+	Сжимает сериализованные данные тайтла. Результат детерминирован, поэтому одинаковые данные дают одинаковые файлы.
+
+	:param data: Бинарное представление JSON.
+	:type data: bytes
+	:param compression: Алгоритм сжатия: _gzip_, _zstd_ или `None`.
+	:type compression: str | None
+	:raises ValueError: Выбрасывается при неизвестном или недоступном алгоритме сжатия.
+	:return: Сжатые данные.
+	:rtype: bytes
+	"""
+
+	if not compression: return data
+	if not IsCompressionAvailable(compression): raise ValueError(f"Unsupported compression: \"{compression}\".")
+	if compression == "gzip": return gzip.compress(data, compresslevel = 3, mtime = 0)
+
+	return zstandard.ZstdCompressor(level = 3).compress(data)
+
+def DecompressTitleData(data: bytes) -> bytes:
+	"""
+	Распаковывает данные тайтла, определяя алгоритм сжатия по сигнатуре. Несжатые данные возвращаются без изменений.
+
+	:param data: Содержимое файла.
+	:type data: bytes
+	:raises ValueError: Выбрасывается, если для распаковки не установлена необходимая библиотека.
+	:return: Бинарное представление JSON.
+	:rtype: bytes
+	"""
+
+	if data.startswith(_CompressionSignatures["gzip"]): return gzip.decompress(data)
+
+	if data.startswith(_CompressionSignatures["zstd"]):
+		if not zstandard: raise ValueError("Unable to decompress title: zstandard is not installed.")
+		return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+	return data
+
+def GetTitleFileCompression(path: PathLike) -> str | None:
+	"""
+	Определяет алгоритм сжатия файла тайтла по сигнатуре.
+
+	:param path: Путь к JSON файлу.
+	:type path: PathLike
+	:return: Алгоритм сжатия или `None` для несжатого либо отсутствующего файла.
+	:rtype: str | None
+	"""
+
+	if not os.path.exists(path): return
+
+	with open(path, "rb") as FileReader: Signature = FileReader.read(4)
+
+	for Compression, CompressionSignature in _CompressionSignatures.items():
+		if Signature.startswith(CompressionSignature): return Compression
+
+#==========================================================================================#
+# >>>>> ШАРДИРОВАННОЕ ХРАНЕНИЕ <<<<< #
+#==========================================================================================#
+
+SHARDS_DIRECTORY = ".shards"
+
+def _WriteIfChanged(path: PathLike, data: bytes, compression: str | None = None) -> bool:
+	"""
+	Записывает файл, только если его содержимое отличается от переданного.
+
+	:param path: Путь к файлу.
+	:type path: PathLike
+	:param data: Бинарное представление JSON.
+	:type data: bytes
+	:param compression: Алгоритм сжатия.
+	:type compression: str | None
+	:return: Возвращает `True`, если файл был записан.
+	:rtype: bool
+	"""
+
+	data = CompressTitleData(data, compression)
+
+	if os.path.exists(path) and os.path.getsize(path) == len(data):
+		with open(path, "rb") as FileReader:
+			if FileReader.read() == data: return False
+
+	with open(path, "wb") as FileWriter: FileWriter.write(data)
+
+	return True
+
+def GetTitleShardsDirectory(path: PathLike) -> str:
+	"""
+	Возвращает путь к каталогу шардов тайтла: `{titles_directory}/.shards/{filename}`.
+
+	:param path: Путь к описательному файлу.
+	:type path: PathLike
+	:return: Путь к каталогу шардов.
+	:rtype: str
+	"""
+
+	Directory, Filename = os.path.split(path)
+
+	return os.path.join(Directory, SHARDS_DIRECTORY, os.path.splitext(Filename)[0])
+
+def IsShardedTitle(data: dict) -> bool:
+	"""
+	Проверяет, хранится ли контент тайтла в шардах.
+
+	:param data: Словарь данных тайтла.
+	:type data: dict
+	:return: Возвращает `True`, если контент вынесен в шарды.
+	:rtype: bool
+	"""
+
+	return "shards" in data
+
+def JoinTitleShards(path: PathLike, data: dict) -> dict:
+	"""
+	Встраивает контент из шардов в данные тайтла.
+
+	:param path: Путь к описательному файлу.
+	:type path: PathLike
+	:param data: Словарь метаданных шардированного тайтла.
+	:type data: dict
+	:raises FileNotFoundError: Выбрасывается при отсутствии шарда.
+	:return: Словарь данных тайтла со встроенным контентом.
+	:rtype: dict
+	"""
+
+	if not IsShardedTitle(data): return data
+
+	Data = {Key: Value for Key, Value in data.items() if Key != "shards"}
+	Data["content"] = {BranchID: ReadTitleShard(path, BranchID) for BranchID in data["shards"]}
+
+	return Data
+
+def ReadTitleShard(path: PathLike, branch_id: int | str) -> list[dict]:
+	"""
+	Считывает шард ветви.
+
+	:param path: Путь к описательному файлу.
+	:type path: PathLike
+	:param branch_id: ID ветви.
+	:type branch_id: int | str
+	:raises FileNotFoundError: Выбрасывается при отсутствии шарда.
+	:return: Список словарей глав ветви.
+	:rtype: list[dict]
+	"""
+
+	return ReadTitleJSON(f"{GetTitleShardsDirectory(path)}/{branch_id}.json")
+
+def RemoveTitleShards(path: PathLike) -> bool:
+	"""
+	Удаляет каталог шардов тайтла.
+
+	:param path: Путь к описательному файлу.
+	:type path: PathLike
+	:return: Возвращает `True`, если каталог существовал и был удалён.
+	:rtype: bool
+	"""
+
+	Directory = GetTitleShardsDirectory(path)
+	if not os.path.exists(Directory): return False
+	shutil.rmtree(Directory)
+
+	try: os.rmdir(os.path.dirname(Directory))
+	except OSError: pass
+
+	return True
+
+def WriteShardedTitle(path: PathLike, data: dict, compression: str | None = None) -> bool:
+	"""
+	Записывает тайтл в шардированном виде: метаданные в описательный файл, а главы каждой ветви в отдельный шард. Записываются только изменившиеся файлы, шарды отсутствующих ветвей удаляются.
+
+	:param path: Путь к описательному файлу.
+	:type path: PathLike
+	:param data: Словарь данных тайтла со встроенным контентом.
+	:type data: dict
+	:param compression: Алгоритм сжатия метаданных и шардов.
+	:type compression: str | None
+	:return: Возвращает `True`, если был записан хотя бы один файл.
+	:rtype: bool
+	"""
+
+	Directory = GetTitleShardsDirectory(path)
+	os.makedirs(Directory, exist_ok = True)
+	Content: dict = data["content"]
+	IsWritten = False
+
+	for BranchID, Chapters in Content.items():
+		if _WriteIfChanged(f"{Directory}/{BranchID}.json", SerializeTitleJSON(Chapters), compression): IsWritten = True
+
+	for Element in os.scandir(Directory):
+		if Element.name.endswith(".json") and Element.name[:-5] not in Content:
+			os.remove(Element.path)
+			IsWritten = True
+
+	Metadata = {Key: Value for Key, Value in data.items() if Key != "shards"}
+	Metadata["content"] = dict()
+	Metadata["shards"] = list(Content.keys())
+	if _WriteIfChanged(path, SerializeTitleJSON(Metadata), compression): IsWritten = True
+
+	return IsWritten
+
+#==========================================================================================#
+# >>>>> РЕЕСТР ФОРМАТОВ <<<<< #
+#==========================================================================================#
+
+@cache
+def GetSupportedFormats() -> tuple[str]:
+	"""
+	Возвращает названия поддерживаемых форматов тайтлов. Реестр строится один раз на процесс.
+
+	:return: Последовательность названий форматов.
+	:rtype: tuple[str]
+	"""
+
+	return tuple(File[:-3] for File in ListDir("Docs/Examples"))
 
 def SafelyReadTitleJSON(path: str) -> dict:
 	"""
@@ -14,9 +471,8 @@ def SafelyReadTitleJSON(path: str) -> dict:
 	:rtype: dict
 	"""
 
-	Formats: tuple[str] = tuple(File[:-3] for File in ListDir("Docs/Examples"))
-	Data = ReadJSON(path)
+	Data = ReadTitleJSON(path)
 	if "format" not in Data.keys(): raise UnsupportedFormat()
-	elif Data["format"] not in Formats: raise UnsupportedFormat(Data["format"])
+	elif Data["format"] not in GetSupportedFormats(): raise UnsupportedFormat(Data["format"])
 
 	return Data
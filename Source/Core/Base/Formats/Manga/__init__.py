@@ -2,10 +2,9 @@ from .Elements import Slide
 from .Enums import Types
 
 from Source.Core.Base.Formats.BaseFormat import BaseChapter, BaseBranch, BaseTitle
+from Source.Core.Base.Formats.Components.Functions import IsShardedTitle, JoinTitleShards, ReadTitleJSON
 from Source.Core import Exceptions
 
-from dublib.Methods.Filesystem import ReadJSON
-
 from typing import Any, Iterable, TYPE_CHECKING
 import os
 
@@ -97,10 +96,10 @@ class Branch(BaseBranch):
 	#==========================================================================================#
 
 	@property
-	def chapters(self) -> list[Chapter]:
-		"""Список глав."""
+	def chapters(self) -> tuple[Chapter]:
+		"""Последовательность глав. Для изменения состава глав используются методы ветви."""
 
-		return self._Chapters
+		return super().chapters
 	
 	#==========================================================================================#
 	# >>>>> МЕТОДЫ <<<<< #
@@ -109,36 +108,36 @@ class Branch(BaseBranch):
 	def __init__(self, id: int):
 		"""
 		Ветвь.
-			ID – уникальный идентификатор ветви.
+
+		:param id: Уникальный идентификатор ветви.
+		:type id: int
 		"""
 
-		#---> Генерация динамических атрибутов.
-		#==========================================================================================#
-		self._ID = id
-		self._Chapters: list[Chapter] = list()
+		super().__init__(id)
 
 	def add_chapter(self, chapter: Chapter):
 		"""
-		Добавляет главу в ветвь.
-			chapter – глава.
+		Добавляет главу в ветвь. Если глава с таким ID уже существует, добавление не происходит.
+
+		:param chapter: Данные главы.
+		:type chapter: Chapter
+		:raises ParsingError: Выбрасывается при отсутствии у добавляемой главы ID.
 		"""
 
-		self._Chapters.append(chapter)
+		super().add_chapter(chapter)
 
 	def get_chapter_by_id(self, id: int) -> Chapter:
 		"""
 		Возвращает главу по её уникальному идентификатору.
-			id – идентификатор главы.
-		"""
 
-		Data = None
-
-		for CurrentChapter in self._Chapters:
-			if CurrentChapter.id == id: Data = CurrentChapter
-
-		if not Data: raise KeyError(id)
+		:param id: ID главы.
+		:type id: int
+		:raises KeyError: Выбрасывается при отсутствии главы в ветви.
+		:return: Глава.
+		:rtype: Chapter
+		"""
 
-		return CurrentChapter
+		return super().get_chapter_by_id(id)
 
 #==========================================================================================#
 # >>>>> ОСНОВНОЙ КЛАСС <<<<< #
@@ -161,22 +160,32 @@ class Manga(BaseTitle):
 	# >>>>> ПЕРЕОПРЕДЕЛЯЕМЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def _ParseBranchesToObjects(self):
-		"""Преобразует данные ветвей в объекты."""
+	def _CreateBranch(self, branch_id: int) -> Branch:
+		"""
+		Создаёт пустую ветвь формата тайтла.
+
+		:param branch_id: ID ветви.
+		:type branch_id: int
+		:return: Ветвь.
+		:rtype: Branch
+		"""
 
-		Branches = list()
+		return Branch(branch_id)
 
-		for BranchID in self._Title["content"]:
-			BufferBranch = Branch(int(BranchID))
+	def _CreateChapter(self, data: dict) -> Chapter:
+		"""
+		Создаёт главу формата тайтла из словаря данных.
 
-			for CurrentChapter in self._Title["content"][BranchID]:
-				BufferChapter = Chapter(self._SystemObjects)
-				BufferChapter.set_dict(CurrentChapter)
-				BufferBranch.add_chapter(BufferChapter)
+		:param data: Словарь данных главы.
+		:type data: dict
+		:return: Глава.
+		:rtype: Chapter
+		"""
 
-			Branches.append(BufferBranch)
+		BufferChapter = Chapter(self._SystemObjects)
+		BufferChapter.set_dict(data)
 
-		self._Branches = Branches
+		return BufferChapter
 
 	def _PostInitMethod(self):
 		"""Метод, выполняющийся после инициализации объекта."""
@@ -221,7 +230,10 @@ class Manga(BaseTitle):
 		MergedChaptersCount = 0
 
 		if os.path.exists(self._TitlePath):
-			LocalData = ReadJSON(self._TitlePath)
+			LocalData = ReadTitleJSON(self._TitlePath)
+
+			if IsShardedTitle(LocalData): LocalData = JoinTitleShards(self._TitlePath, LocalData)
+			else: self._RememberLocalState(self._GetDataHash(LocalData))
 		
 			if LocalData.get("format") != "melon-manga":
 				self._SystemObjects.logger.portals.unsupported_format(LocalData.get("format"))
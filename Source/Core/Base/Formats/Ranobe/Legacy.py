@@ -12,7 +12,6 @@ from typing import Any, Iterable, Literal, TYPE_CHECKING
 from urllib.parse import unquote, urlparse
 from pathlib import Path
 from os import PathLike
-from time import sleep
 import base64
 import os
 
@@ -121,7 +120,7 @@ class LegacyChapter(BaseChapter):
 		
 	def __DownloadImages(self, paragraph: str) -> str:
 		"""
-		Скачивает иллюстрации из абзаца.
+		Скачивает иллюстрации из абзаца. Отсутствующие локально иллюстрации скачиваются одним пакетом.
 
 		:param paragraph: Абзац текста.
 		:type paragraph: str
@@ -132,6 +131,16 @@ class LegacyChapter(BaseChapter):
 		Parser = self._Title.parser
 		Soup = BeautifulSoup(paragraph, "html.parser")
 		Images = Soup.find_all("img")
+		PendingLinks = list()
+
+		for Image in Images:
+			Link = Image.get("src")
+			if not Link or Link.startswith("data:"): continue
+			Illustration = _IllustrationData(self._Title, self, os.path.basename(unquote(urlparse(Link).path)))
+			if not Illustration.is_exists or self._SystemObjects.FORCE_MODE: PendingLinks.append(Link)
+
+		PendingLinks = tuple(dict.fromkeys(PendingLinks))
+		Downloaded = dict(zip(PendingLinks, Parser.source_operator.images(PendingLinks)))
 		
 		for Image in Images:
 			Link = Image.get("src")
@@ -154,10 +163,10 @@ class LegacyChapter(BaseChapter):
 				print("Already exists.")
 				continue
 			
-			Status = Parser.source_operator.image(Link)
+			Status = Downloaded.pop(Link, None)
+			if Status == None: Status = Parser.source_operator.image(Link)
 
 			if Status:
-				sleep(Parser.settings.common.delay)
 				Image.attrs = {"src": Illustration.mounted_path}
 				Parser.images_downloader.move_from_temp(Illustration.directory, Status.value)
 
@@ -2,12 +2,11 @@ from .Elements import Blockquote, Header, Image, Paragraph
 from .Enums import ChaptersTypes
 
 from ..Components.WordsDictionary import CheckLanguageCode
+from ..Components.Functions import IsShardedTitle, JoinTitleShards, ReadTitleJSON
 
 from Source.Core.Base.Formats.BaseFormat import BaseChapter, BaseBranch, BaseTitle
 from Source.Core import Exceptions
 
-from dublib.Methods.Filesystem import ReadJSON
-
 from typing import Iterable, TYPE_CHECKING
 import os
 
@@ -131,13 +130,12 @@ class Branch(BaseBranch):
 	def __init__(self, id: int):
 		"""
 		Ветвь.
-			ID – уникальный идентификатор ветви.
+
+		:param id: Уникальный идентификатор ветви.
+		:type id: int
 		"""
 
-		#---> Генерация динамических атрибутов.
-		#==========================================================================================#
-		self._ID = id
-		self._Chapters: list[Chapter] = list()
+		super().__init__(id)
 
 	def add_chapter(self, chapter: Chapter):
 		"""
@@ -213,22 +211,32 @@ class Ranobe(BaseTitle):
 	# >>>>> ПЕРЕОПРЕДЕЛЯЕМЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def _ParseBranchesToObjects(self):
-		"""Преобразует данные ветвей в объекты."""
+	def _CreateBranch(self, branch_id: int) -> Branch:
+		"""
+		Создаёт пустую ветвь формата тайтла.
 
-		Branches = list()
+		:param branch_id: ID ветви.
+		:type branch_id: int
+		:return: Ветвь.
+		:rtype: Branch
+		"""
 
-		for BranchID in self._Title["content"]:
-			BufferBranch = Branch(int(BranchID))
+		return Branch(branch_id)
 
-			for CurrentChapter in self._Title["content"][BranchID]:
-				BufferChapter = Chapter(self._SystemObjects, self)
-				BufferChapter.set_dict(CurrentChapter)
-				BufferBranch.add_chapter(BufferChapter)
+	def _CreateChapter(self, data: dict) -> Chapter:
+		"""
+		Создаёт главу формата тайтла из словаря данных.
 
-			Branches.append(BufferBranch)
+		:param data: Словарь данных главы.
+		:type data: dict
+		:return: Глава.
+		:rtype: Chapter
+		"""
 
-		self._Branches = Branches
+		BufferChapter = Chapter(self._SystemObjects, self)
+		BufferChapter.set_dict(data)
+
+		return BufferChapter
 
 	def _PostInitMethod(self):
 		"""Метод, выполняющийся после инициализации объекта."""
@@ -273,7 +281,10 @@ class Ranobe(BaseTitle):
 		MergedChaptersCount = 0
 
 		if os.path.exists(self._TitlePath):
-			LocalData = ReadJSON(self._TitlePath)
+			LocalData = ReadTitleJSON(self._TitlePath)
+
+			if IsShardedTitle(LocalData): LocalData = JoinTitleShards(self._TitlePath, LocalData)
+			else: self._RememberLocalState(self._GetDataHash(LocalData))
 		
 			if LocalData.get("format") != "melon-ranobe":
 				self._SystemObjects.logger.unsupported_format(LocalData.get("format"))
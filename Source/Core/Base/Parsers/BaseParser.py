@@ -24,6 +24,12 @@ class BaseParser:
 
 		return self._ImagesDownloader
 
+	@property
+	def is_concurrent_amending(self) -> bool:
+		"""Состояние: поддерживает ли парсер параллельное дополнение глав."""
+
+		return self._IsConcurrentAmending
+
 	@property
 	def manifest(self) -> "ParserManifest":
 		"""Манифест парсера."""
@@ -95,6 +101,8 @@ class BaseParser:
 		self._Requestor = entry_point.source_operator.requestor
 		self._ImagesDownloader = entry_point.source_operator.images_downloader
 
+		self._IsConcurrentAmending = False
+
 		self._PostInitMethod()
 
 	def amend(self, branch: BaseBranch, chapter: BaseChapter):
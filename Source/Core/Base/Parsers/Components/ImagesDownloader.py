@@ -1,16 +1,28 @@
+from Source.Core.SystemObjects.Sessions import DEFAULT_POOL_SIZE
+
 from dublib.Methods.Filesystem import NormalizePath
 from dublib.Engine.Bus import ExecutionStatus
-from dublib.WebRequestor import WebRequestor
+from dublib.WebRequestor import Protocols, Proxy, WebLibs, WebRequestor, WebResponse
+
+from .ImagesStore import ImagesStore
+from .RateLimiter import RateLimiter
 
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, TYPE_CHECKING
+from contextlib import nullcontext
 from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from threading import get_ident
 from pathlib import Path
 from os import PathLike
 from io import BytesIO
+from time import sleep
+import hashlib
+import random
 import shutil
 import os
 
 from PIL import Image
+import requests
 
 if TYPE_CHECKING:
 	from Source.Core.SystemObjects import SystemObjects
@@ -19,11 +31,86 @@ if TYPE_CHECKING:
 # >>>>> ВСПОМОГАТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
 #==========================================================================================#
 
+IMAGE_HEAD_SIZE = 65536
+STREAM_CHUNK_SIZE = 65536
+
+JPEG_SOF_MARKERS = frozenset((0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF))
+JPEG_STANDALONE_MARKERS = frozenset((0x01, 0xD0, 0xD1, 0xD2, 0xD3, 0xD4, 0xD5, 0xD6, 0xD7, 0xD8))
+
 @dataclass(frozen = True)
 class ImageResolution:
 	width: int
 	height: int
 
+def _SniffJPEGResolution(data: bytes) -> tuple[int, int] | None:
+	"""
+	Определяет разрешение изображения JPEG по сегменту SOF.
+
+	:param data: Начало файла.
+	:type data: bytes
+	:return: Ширина и высота или `None`, если сегмент SOF не найден в переданных данных.
+	:rtype: tuple[int, int] | None
+	"""
+
+	Position = 2
+	Length = len(data)
+
+	while Position + 4 <= Length:
+		if data[Position] != 0xFF: return None
+		while Position < Length and data[Position] == 0xFF: Position += 1
+		if Position >= Length: return None
+
+		Marker = data[Position]
+		Position += 1
+
+		if Marker in JPEG_STANDALONE_MARKERS: continue
+		if Marker == 0xD9 or Position + 2 > Length: return None
+
+		if Marker in JPEG_SOF_MARKERS:
+			if Position + 7 > Length: return None
+			return int.from_bytes(data[Position + 5:Position + 7], "big"), int.from_bytes(data[Position + 3:Position + 5], "big")
+
+		Position += int.from_bytes(data[Position:Position + 2], "big")
+
+	return None
+
+def SniffImageResolution(data: bytes) -> ImageResolution | None:
+	"""
+	Определяет разрешение изображения по заголовку без участия Pillow. Поддерживаются форматы JPEG, PNG, GIF и WebP (VP8, VP8L, VP8X). Достаточно передать первые несколько килобайт файла.
+
+	:param data: Бинарное представление изображения или его начало.
+	:type data: bytes
+	:return: Разрешение изображения или `None`, если формат не поддерживается либо данных недостаточно.
+	:rtype: ImageResolution | None
+	"""
+
+	Size = None
+
+	if data[:3] == b"\xFF\xD8\xFF": Size = _SniffJPEGResolution(data)
+
+	elif data[:8] == b"\x89PNG\r\n\x1a\n" and data[12:16] == b"IHDR" and len(data) >= 24:
+		Size = int.from_bytes(data[16:20], "big"), int.from_bytes(data[20:24], "big")
+
+	elif data[:6] in (b"GIF87a", b"GIF89a") and len(data) >= 10:
+		Size = int.from_bytes(data[6:8], "little"), int.from_bytes(data[8:10], "little")
+
+	elif data[:4] == b"RIFF" and data[8:12] == b"WEBP" and len(data) >= 30:
+		Chunk = data[12:16]
+
+		if Chunk == b"VP8 " and data[23:26] == b"\x9d\x01\x2a":
+			Size = int.from_bytes(data[26:28], "little") & 0x3FFF, int.from_bytes(data[28:30], "little") & 0x3FFF
+
+		elif Chunk == b"VP8L" and data[20] == 0x2F:
+			Bits = int.from_bytes(data[21:25], "little")
+			Size = (Bits & 0x3FFF) + 1, ((Bits >> 14) & 0x3FFF) + 1
+
+		elif Chunk == b"VP8X":
+			Size = int.from_bytes(data[24:27], "little") + 1, int.from_bytes(data[27:30], "little") + 1
+
+	if not Size or not Size[0] or not Size[1]: return None
+
+	return ImageResolution(Size[0], Size[1])
+
 class ImageDownloadingStatus(ExecutionStatus):
 	"""Статус скачивания изображения."""
 
@@ -43,6 +130,12 @@ class ImageDownloadingStatus(ExecutionStatus):
 
 		return self.__IsReplacedByStub
 	
+	@property
+	def md5(self) -> str | None:
+		"""MD5-хэш содержимого скачанного изображения."""
+
+		return self.__MD5
+
 	@property
 	def resolution(self) -> ImageResolution | None:
 		"""Разрешение изображения."""
@@ -58,6 +151,7 @@ class ImageDownloadingStatus(ExecutionStatus):
 
 		self.__Resolution: ImageResolution | None = None
 		self.__IsReplacedByStub: bool = False
+		self.__MD5: str | None = None
 		self.__IsExists: bool = False
 
 	#==========================================================================================#
@@ -84,6 +178,16 @@ class ImageDownloadingStatus(ExecutionStatus):
 
 		self.__IsReplacedByStub = status
 
+	def set_md5(self, md5: str | None):
+		"""
+		Задаёт MD5-хэш содержимого изображения.
+
+		:param md5: MD5-хэш в шестнадцатеричном представлении.
+		:type md5: str | None
+		"""
+
+		self.__MD5 = md5
+
 	def set_resolution(self, resolution: ImageResolution):
 		"""
 		Задаёт разрешение изображения.
@@ -94,6 +198,124 @@ class ImageDownloadingStatus(ExecutionStatus):
 
 		self.__Resolution = resolution
 
+class _ImageStream:
+	"""Приёмник потока изображения. Записывает фрагменты во временный файл, попутно подсчитывая размер, MD5-хэш и определяя разрешение по заголовку файла."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def md5(self) -> str:
+		"""MD5-хэш полученных данных."""
+
+		return self.__Hash.hexdigest()
+
+	@property
+	def resolution(self) -> ImageResolution | None:
+		"""Разрешение изображения или `None`, если его не удалось определить либо определение отключено."""
+
+		return self.__Resolution
+
+	@property
+	def size(self) -> int:
+		"""Количество полученных байтов."""
+
+		return self.__Size
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __ReadResolution(self, source: BytesIO | str) -> ImageResolution | None:
+		"""
+		Определяет разрешение изображения. Pillow при открытии считывает только заголовок файла, не декодируя пиксели.
+
+		:param source: Буфер с началом файла или путь к файлу.
+		:type source: BytesIO | str
+		:return: Разрешение изображения или `None` при ошибке определения.
+		:rtype: ImageResolution | None
+		"""
+
+		try:
+			with Image.open(source) as Buffer: return ImageResolution(Buffer.size[0], Buffer.size[1])
+
+		except Exception: return None
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, path: str, sizing: bool):
+		"""
+		Приёмник потока изображения. Записывает фрагменты во временный файл, попутно подсчитывая размер, MD5-хэш и определяя разрешение по заголовку файла.
+
+		:param path: Путь к итоговому файлу изображения.
+		:type path: str
+		:param sizing: Указывает, нужно ли определять разрешение изображения.
+		:type sizing: bool
+		"""
+
+		self.__Path = path
+		self.__TempPath = f"{path}.{os.getpid()}-{get_ident()}.part"
+		self.__Sizing = sizing
+
+		self.__FileWriter = None
+		self.reset()
+
+	def close(self):
+		"""Завершает запись временного файла. Если разрешение не удалось определить по началу потока, заголовок считывается из файла."""
+
+		if not self.__FileWriter: return
+		self.__FileWriter.close()
+		self.__FileWriter = None
+
+		if self.__Sizing and not self.__Resolution: self.__Resolution = self.__ReadResolution(self.__TempPath)
+
+	def commit(self):
+		"""Атомарно заменяет итоговый файл изображения временным."""
+
+		self.close()
+		os.replace(self.__TempPath, self.__Path)
+
+	def discard(self):
+		"""Удаляет временный файл, если тот не был перемещён."""
+
+		self.close()
+		if os.path.exists(self.__TempPath): os.remove(self.__TempPath)
+
+	def reset(self):
+		"""Сбрасывает полученные данные, например перед повторной попыткой запроса."""
+
+		if self.__FileWriter: self.__FileWriter.close()
+		self.__FileWriter = None
+
+		self.__Hash = hashlib.md5()
+		self.__Head = bytearray()
+		self.__Resolution: ImageResolution | None = None
+		self.__Size = 0
+
+	def write(self, chunk: bytes):
+		"""
+		Записывает фрагмент потока.
+
+		:param chunk: Фрагмент данных.
+		:type chunk: bytes
+		"""
+
+		if not chunk: return
+		if not self.__FileWriter: self.__FileWriter = open(self.__TempPath, "wb")
+
+		self.__FileWriter.write(chunk)
+		self.__Hash.update(chunk)
+		self.__Size += len(chunk)
+
+		if self.__Sizing and not self.__Resolution and self.__Head != None:
+			self.__Head += chunk[:IMAGE_HEAD_SIZE - len(self.__Head)]
+			self.__Resolution = SniffImageResolution(self.__Head)
+			if not self.__Resolution and len(self.__Head) >= IMAGE_HEAD_SIZE: self.__Resolution = self.__ReadResolution(BytesIO(self.__Head))
+			if self.__Resolution or len(self.__Head) >= IMAGE_HEAD_SIZE: self.__Head = None
+
 #==========================================================================================#
 # >>>>> ОСНОВНОЙ КЛАСС <<<<< #
 #==========================================================================================#
@@ -105,17 +327,146 @@ class ImagesDownloader:
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
 
+	@property
+	def images_store(self) -> ImagesStore | None:
+		"""Хранилище изображений с адресацией по хэшу содержимого или `None`, если дедупликация отключена."""
+
+		return self.__ImagesStore
+
 	@property
 	def requestor(self) -> WebRequestor:
 		"""Установленный менеджер запросов."""
 
 		return self.__Requestor
+
+	@property
+	def rate_limiter(self) -> RateLimiter:
+		"""Ограничитель частоты запросов к источнику."""
+
+		return self.__RateLimiter
 			
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __Download(self, url: str, stream: _ImageStream) -> WebResponse:
+		"""
+		Скачивает изображение, передавая тело ответа в приёмник. Если менеджер запросов позволяет загрузку потоком, тело передаётся фрагментами, иначе выполняется обычный запрос. Кэш ответов к изображениям не применяется.
+
+		:param url: Ссылка на изображение.
+		:type url: str
+		:param stream: Приёмник потока изображения.
+		:type stream: _ImageStream
+		:return: Контейнер ответа. Содержимое ответа в нём не сохраняется.
+		:rtype: WebResponse
+		"""
+
+		Transport = self.__GetStreamingTransport()
+		if Transport: return self.__DownloadStreamed(url, stream, *Transport)
+
+		ResponsesCache = getattr(self.__Requestor.request, "responses_cache", None)
+
+		with ResponsesCache.bypass() if ResponsesCache else nullcontext(): Response = self.__Requestor.get(url)
+		if Response.status_code == 200: stream.write(Response.content)
+
+		return Response
+
+	def __DownloadStreamed(self, url: str, stream: _ImageStream, session: requests.Session, proxies: tuple[Proxy]) -> WebResponse:
+		"""
+		Скачивает изображение потоком через сессию менеджера запросов (с её cookies). Повторы, ротация прокси и переключение их протокола повторяют правила `WebRequestor.request()`, так как сам этот метод считывает тело ответа в память и для потоковой загрузки использован быть не может.
+
+		:param url: Ссылка на изображение.
+		:type url: str
+		:param stream: Приёмник потока изображения.
+		:type stream: _ImageStream
+		:param session: Сессия библиотеки **requests**.
+		:type session: requests.Session
+		:param proxies: Прокси менеджера запросов.
+		:type proxies: tuple[Proxy]
+		:return: Контейнер ответа. Содержимое ответа в нём не сохраняется.
+		:rtype: WebResponse
+		"""
+
+		Config = self.__Requestor.config
+		Response = WebResponse(Config)
+
+		for Try in range(1 + Config.retries):
+			if Try: sleep(Config.delay)
+			self.__RateLimiter.acquire()
+
+			try:
+				CurrentProxy = random.choice(proxies) if proxies else None
+				Response.set_status_code(None)
+				Response.set_status_code(self.__StreamResponse(session, url, CurrentProxy, stream))
+
+				#---> Переключение HTTP/HTTPS протоколов прокси при неудачном запросе.
+				#==========================================================================================#
+				if not Response.ok and CurrentProxy and Config.switch_proxy_protocol and CurrentProxy.protocol in (Protocols.HTTP, Protocols.HTTPS):
+					sleep(Config.delay)
+					CurrentProxy.set_protocol(Protocols.HTTPS if CurrentProxy.protocol == Protocols.HTTP else Protocols.HTTP)
+					StatusCode = self.__StreamResponse(session, url, CurrentProxy, stream)
+					if StatusCode in Config.good_codes: Response.set_status_code(StatusCode)
+
+			except Exception as ExceptionData: Response.push_exception(ExceptionData)
+
+			if Response.ok: break
+
+		return Response
+
+	def __GetStreamingTransport(self) -> tuple[requests.Session, tuple[Proxy]] | None:
+		"""
+		Возвращает сессию и прокси менеджера запросов для потоковой загрузки.
+
+		Публичный API dublib потоковых запросов не предоставляет, а сессия и прокси менеджера хранятся в приватных атрибутах. Это единственное место, где к ним обращаются. Если используется библиотека, отличная от **requests**, или внутреннее устройство dublib изменилось, возвращается `None`, и загрузка выполняется обычным запросом через менеджер.
+
+		:return: Сессия **requests** и прокси или `None`, если загрузка потоком недоступна.
+		:rtype: tuple[requests.Session, tuple[Proxy]] | None
+		"""
+
+		if self.__Requestor.config.lib != WebLibs.requests: return None
+		Session = getattr(self.__Requestor, "_WebRequestor__Session", None)
+		Proxies = getattr(self.__Requestor, "_WebRequestor__Proxies", None)
+		if not isinstance(Session, requests.Session) or not isinstance(Proxies, tuple): return None
+
+		return Session, Proxies
+
+	def __StreamResponse(self, session: requests.Session, url: str, proxy: Proxy | None, stream: _ImageStream) -> int:
+		"""
+		Выполняет одну попытку потокового GET-запроса и при коде _200_ передаёт тело ответа в приёмник.
+
+		:param session: Сессия библиотеки **requests**.
+		:type session: requests.Session
+		:param url: Ссылка на изображение.
+		:type url: str
+		:param proxy: Данные прокси.
+		:type proxy: Proxy | None
+		:param stream: Приёмник потока изображения.
+		:type stream: _ImageStream
+		:return: Код ответа.
+		:rtype: int
+		"""
+
+		Config = self.__Requestor.config
+		stream.reset()
+
+		with session.get(
+			url = url,
+			headers = Config.headers,
+			proxies = proxy.to_dict() if proxy else None,
+			allow_redirects = Config.redirecting,
+			verify = Config.verify_ssl,
+			stream = True
+		) as Answer:
+			if Answer.status_code == 200:
+				for Chunk in Answer.iter_content(STREAM_CHUNK_SIZE): stream.write(Chunk)
+
+			return Answer.status_code
+
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 	
-	def __init__(self, system_objects: "SystemObjects", requestor: WebRequestor):
+	def __init__(self, system_objects: "SystemObjects", requestor: WebRequestor, rate_limiter: RateLimiter | None = None):
 		"""
 		Оператор загрузки изображений.
 
@@ -123,16 +474,49 @@ class ImagesDownloader:
 		:type system_objects: SystemObjects
 		:param requestor: Менеджер запросов.
 		:type requestor: WebRequestor
+		:param rate_limiter: Ограничитель частоты запросов. По умолчанию создаётся на основе интервала из настроек парсера.
+		:type rate_limiter: RateLimiter | None
 		"""
 		
 		self.__SystemObjects = system_objects
-		self.__Requestor = requestor
-
 		self.__ParserSettings = self.__SystemObjects.controller.current_parser_settings
 
+		self.__RateLimiter = rate_limiter or RateLimiter(self.__ParserSettings.common.delay)
+		self.__Requestor = self.__RateLimiter.bind(requestor)
+		self.__ImagesStore = ImagesStore(self.__ParserSettings.directories.images_store) if self.__ParserSettings.common.deduplicate_images else None
+
+	def batch(self, function: Callable[[Any], ImageDownloadingStatus], arguments: Iterable[Any], workers: int | None = None) -> list[ImageDownloadingStatus]:
+		"""
+		Выполняет пакет загрузок в пуле потоков. Каждая загрузка выполняется через общий менеджер запросов, поэтому ограничение частоты запросов и пул соединений сохраняются.
+
+		:param function: Функция загрузки одного изображения, принимающая элемент пакета.
+		:type function: Callable[[Any], ImageDownloadingStatus]
+		:param arguments: Элементы пакета, например ссылки на изображения.
+		:type arguments: Iterable[Any]
+		:param workers: Максимальное количество одновременных загрузок. По умолчанию равно размеру пула соединений из настроек парсера.
+		:type workers: int | None
+		:return: Список статусов загрузки в порядке следования элементов пакета. Исключения функции загрузки преобразуются в статусы с ошибкой.
+		:rtype: list[ImageDownloadingStatus]
+		"""
+
+		arguments = tuple(arguments)
+		if not arguments: return list()
+		workers = max(int(workers or self.__ParserSettings.common.pool_size or DEFAULT_POOL_SIZE), 1)
+
+		def Download(argument: Any) -> ImageDownloadingStatus:
+			try: return function(argument)
+
+			except Exception as ExceptionData:
+				Status = ImageDownloadingStatus()
+				Status.push_error(f"Unable to download image: {ExceptionData}")
+
+				return Status
+
+		with ThreadPoolExecutor(max_workers = min(workers, len(arguments))) as Executor: return list(Executor.map(Download, arguments))
+
 	def get_image_resolution(self, data: bytes) -> ImageResolution | None:
 		"""
-		Получает разрешение иллюстрации. Вычисляется на основе бинарного представления.
+		Получает разрешение иллюстрации. Вычисляется на основе бинарного представления: для распространённых форматов размеры считываются из заголовка, а Pillow используется только для прочих форматов.
 
 		При отключении опцией парсера возвращает `None`.
 
@@ -143,7 +527,8 @@ class ImagesDownloader:
 		if not self.__ParserSettings.common.sizing_images: return
 		if not data: return
 
-		Resolution = None
+		Resolution = SniffImageResolution(data)
+		if Resolution: return Resolution
 
 		try:
 			Buffer = Image.open(BytesIO(data))
@@ -153,6 +538,22 @@ class ImagesDownloader:
 
 		return Resolution
 
+	def images(self, urls: Iterable[str], directory: PathLike | None = None, workers: int | None = None) -> list[ImageDownloadingStatus]:
+		"""
+		Одновременно скачивает несколько изображений.
+
+		:param urls: Последовательность ссылок на изображения.
+		:type urls: Iterable[str]
+		:param directory: Путь к каталогу, в который нужно сохранить файлы. По умолчанию будет использован временный каталог парсера.
+		:type directory: PathLike | None
+		:param workers: Максимальное количество одновременных загрузок. По умолчанию равно размеру пула соединений из настроек парсера.
+		:type workers: int | None
+		:return: Список статусов скачивания в порядке следования ссылок.
+		:rtype: list[ImageDownloadingStatus]
+		"""
+
+		return self.batch(lambda URL: self.image(URL, directory), urls, workers)
+
 	def is_exists(self, url: str, directory: PathLike | None = None, filename: str | None = None, is_full_filename: bool = True) -> bool:
 		"""
 		Проверяет существование изображения в целевой директории по ссылке.
@@ -214,31 +615,40 @@ class ImagesDownloader:
 		#---> Скачивание файла.
 		#==========================================================================================#
 		if not Status.is_exists or self.__SystemObjects.FORCE_MODE:
-			Response = self.__Requestor.get(url)
-			Status.code = Response.status_code
+			Stream = _ImageStream(ImagePath, self.__ParserSettings.common.sizing_images)
 			IsDownloaded = False
 
-			if Response.status_code == 200:
-				Resolution = self.get_image_resolution(Response.content)
-				if Resolution: Status.set_resolution(Resolution)
-				
-				if len(Response.content) > 1000:
-					with open(ImagePath, "wb") as FileWriter: FileWriter.write(Response.content)
-					Status.value = filename + Filetype
-					IsDownloaded = True
-
-					if Status.is_exists: Status.push_message("Overwritten.")
-					else: Status.push_message("Done.")
+			try:
+				Response = self.__Download(url, Stream)
+				Stream.close()
+				Status.code = Response.status_code
+
+				if Response.status_code == 200:
+					if Stream.resolution: Status.set_resolution(Stream.resolution)
+					Status.set_md5(Stream.md5)
 					
-				elif self.__ParserSettings.common.bad_image_stub: Message = f"Image doesn't contain enough bytes: \"{url}\"."
+					if self.__ParserSettings.filters.image.check_md5(Stream.md5): Message = f"Image filtered by MD5: \"{url}\"."
+
+					elif Stream.size > 1000:
+						Stream.commit()
+						Status.value = filename + Filetype
+						IsDownloaded = True
+
+						if Status.is_exists: Status.push_message("Overwritten.")
+						else: Status.push_message("Done.")
+						
+					else: Message = f"Image doesn't contain enough bytes: \"{url}\"."
+
+				elif Response.status_code == 404: Message = f"Image not found: \"{url}\"."
+				else: Message = f"Unable to download image: \"{url}\"."
 
-			elif Response.status_code == 404: Message = f"Image not found: \"{url}\"."
-			else: Message = f"Unable to download image: \"{url}\"."
+			finally: Stream.discard()
 
 			#---> Замена изображения заглушкой.
 			#==========================================================================================#
 			if not IsDownloaded and self.__ParserSettings.common.bad_image_stub:
-				shutil.copy2(self.__ParserSettings.common.bad_image_stub, ImagePath)
+				if self.__ImagesStore: self.__ImagesStore.store(self.__ParserSettings.common.bad_image_stub, ImagePath, move = False)
+				else: shutil.copy2(self.__ParserSettings.common.bad_image_stub, ImagePath)
 				Message = f"{Message} Replaced by stub."
 				Status.set_is_replaced_by_stub(True)
 				Status.push_warning(Message)
@@ -254,7 +664,7 @@ class ImagesDownloader:
 
 	def move_from_temp(self, directory: PathLike, original_filename: str, filename: str | None = None, is_full_filename: bool = True) -> ExecutionStatus:
 		"""
-		Перемещает изображение из временного каталога парсера в друкгую директорию.
+		Перемещает изображение из временного каталога парсера в друкгую директорию. При включённой дедупликации файл помещается в хранилище изображений, а в целевой директории создаётся жёсткая ссылка на него.
 
 		:param directory: Целевая директория.
 		:type directory: PathLike
@@ -288,7 +698,8 @@ class ImagesDownloader:
 			os.remove(OriginalPath)
 
 		else:
-			shutil.move(OriginalPath, TargetPath)
+			if self.__ImagesStore: self.__ImagesStore.store(OriginalPath, TargetPath)
+			else: shutil.move(OriginalPath, TargetPath)
 			Status.value = True
 
 		return Status
@@ -0,0 +1,144 @@
+from os import PathLike
+from pathlib import Path
+import hashlib
+import shutil
+import os
+
+class ImagesStore:
+	"""Хранилище изображений с адресацией по хэшу содержимого. Файлы в каталогах тайтлов являются жёсткими ссылками на файлы хранилища."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def directory(self) -> PathLike:
+		"""Путь к каталогу хранилища."""
+
+		return self.__Directory
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetHash(self, path: PathLike) -> str:
+		"""
+		Вычисляет хэш содержимого файла.
+
+		:param path: Путь к файлу.
+		:type path: PathLike
+		:return: Хэш SHA-256 в шестнадцатеричном представлении.
+		:rtype: str
+		"""
+
+		Hash = hashlib.sha256()
+
+		with open(path, "rb") as FileReader:
+			for Chunk in iter(lambda: FileReader.read(1048576), b""): Hash.update(Chunk)
+
+		return Hash.hexdigest()
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, directory: PathLike):
+		"""
+		Хранилище изображений с адресацией по хэшу содержимого. Файлы в каталогах тайтлов являются жёсткими ссылками на файлы хранилища.
+
+		:param directory: Путь к каталогу хранилища.
+		:type directory: PathLike
+		"""
+
+		self.__Directory = directory
+
+	def get_path(self, content_hash: str, suffix: str = "") -> str:
+		"""
+		Возвращает путь к файлу хранилища.
+
+		:param content_hash: Хэш содержимого.
+		:type content_hash: str
+		:param suffix: Расширение файла.
+		:type suffix: str
+		:return: Путь к файлу хранилища вида `{directory}/{hash[:2]}/{hash}{suffix}`.
+		:rtype: str
+		"""
+
+		return f"{self.__Directory}/{content_hash[:2]}/{content_hash}{suffix.lower()}"
+
+	def link(self, source: PathLike, destination: PathLike) -> bool:
+		"""
+		Атомарно заменяет файл назначения жёсткой ссылкой на исходный файл, а при невозможности создания ссылки – копией.
+
+		:param source: Путь к исходному файлу.
+		:type source: PathLike
+		:param destination: Путь к файлу назначения.
+		:type destination: PathLike
+		:return: Возвращает `True`, если создана жёсткая ссылка, и `False`, если файл скопирован.
+		:rtype: bool
+		"""
+
+		if os.path.exists(destination) and os.path.samefile(source, destination): return True
+
+		TempPath = f"{destination}.link"
+		if os.path.exists(TempPath): os.remove(TempPath)
+		IsLinked = True
+
+		try: os.link(source, TempPath)
+
+		except OSError:
+			shutil.copy2(source, TempPath)
+			IsLinked = False
+
+		os.replace(TempPath, destination)
+
+		return IsLinked
+
+	def put(self, path: PathLike, move: bool = False) -> str:
+		"""
+		Помещает файл в хранилище. Если файл с таким же содержимым уже хранится, новая копия не создаётся.
+
+		:param path: Путь к файлу.
+		:type path: PathLike
+		:param move: Указывает, нужно ли переместить файл в хранилище. В противном случае исходный файл остаётся на месте.
+		:type move: bool
+		:return: Путь к файлу хранилища.
+		:rtype: str
+		"""
+
+		StorePath = self.get_path(self.__GetHash(path), Path(path).suffix)
+
+		if os.path.exists(StorePath):
+			if move: os.remove(path)
+			return StorePath
+
+		os.makedirs(os.path.dirname(StorePath), exist_ok = True)
+
+		if move:
+			shutil.move(path, StorePath)
+			return StorePath
+
+		try: os.link(path, StorePath)
+		except FileExistsError: pass
+		except OSError: shutil.copy2(path, StorePath)
+
+		return StorePath
+
+	def store(self, source: PathLike, destination: PathLike, move: bool = True) -> str:
+		"""
+		Помещает файл в хранилище и создаёт на него жёсткую ссылку по пути назначения.
+
+		:param source: Путь к исходному файлу.
+		:type source: PathLike
+		:param destination: Путь к файлу назначения.
+		:type destination: PathLike
+		:param move: Указывает, нужно ли переместить исходный файл в хранилище.
+		:type move: bool
+		:return: Путь к файлу хранилища.
+		:rtype: str
+		"""
+
+		StorePath = self.put(source, move)
+		self.link(StorePath, destination)
+
+		return StorePath
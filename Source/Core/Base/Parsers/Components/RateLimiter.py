@@ -0,0 +1,82 @@
+from dublib.WebRequestor import WebRequestor
+
+from time import monotonic, sleep
+from functools import wraps
+from threading import Lock
+
+class RateLimiter:
+	"""Ограничитель частоты запросов к источнику, работающий по алгоритму маркерной корзины."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def capacity(self) -> int:
+		"""Максимальное количество маркеров в корзине."""
+
+		return self.__Capacity
+
+	@property
+	def rate(self) -> float | None:
+		"""Количество маркеров, пополняемых за секунду. При значении `None` ограничение не применяется."""
+
+		return self.__Rate
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, delay: float, capacity: int = 1):
+		"""
+		Ограничитель частоты запросов к источнику, работающий по алгоритму маркерной корзины.
+
+		:param delay: Минимальный интервал в секундах между последовательными запросами. Нулевое значение отключает ограничение.
+		:type delay: float
+		:param capacity: Максимальное количество маркеров в корзине, т. е. число запросов, выполняемых без ожидания после простоя.
+		:type capacity: int
+		"""
+
+		self.__Rate = 1 / delay if delay and delay > 0 else None
+		self.__Capacity = max(capacity, 1)
+
+		self.__Tokens = float(self.__Capacity)
+		self.__LastUpdate = monotonic()
+		self.__Locker = Lock()
+
+	def acquire(self):
+		"""Получает маркер для выполнения запроса. При пустой корзине блокирует поток до пополнения."""
+
+		if not self.__Rate: return
+
+		with self.__Locker:
+			Now = monotonic()
+			self.__Tokens = min(self.__Capacity, self.__Tokens + (Now - self.__LastUpdate) * self.__Rate)
+			self.__LastUpdate = Now
+			self.__Tokens -= 1
+			Delay = -self.__Tokens / self.__Rate if self.__Tokens < 0 else 0
+
+		if Delay > 0: sleep(Delay)
+
+	def bind(self, requestor: WebRequestor) -> WebRequestor:
+		"""
+		Подключает ограничитель к менеджеру запросов: каждый исходящий запрос будет получать маркер.
+
+		:param requestor: Менеджер запросов.
+		:type requestor: WebRequestor
+		:return: Тот же менеджер запросов.
+		:rtype: WebRequestor
+		"""
+
+		Request = requestor.request
+		if getattr(Request, "rate_limiter", None) is self: return requestor
+
+		@wraps(Request)
+		def LimitedRequest(*args, **kwargs):
+			self.acquire()
+			return Request(*args, **kwargs)
+
+		LimitedRequest.rate_limiter = self
+		requestor.request = LimitedRequest
+
+		return requestor
@@ -0,0 +1,297 @@
+from dublib.WebRequestor import RequestsTypes, WebRequestor, WebResponse
+
+from email.utils import formatdate
+from contextlib import contextmanager
+from threading import get_ident, local
+from typing import Callable, Iterator
+from functools import wraps
+from os import PathLike
+from time import time
+import hashlib
+import shutil
+import json
+import os
+
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+_LastModified = local()
+
+def _CaptureLastModified(requestor: WebRequestor) -> bool:
+	"""
+	Подключает к менеджеру запросов запоминание заголовка `Last-Modified` последнего полученного в потоке ответа на GET-запрос.
+
+	Контейнер ответа **dublib** заголовков не хранит, а исходный ответ библиотеки доступен только обработчикам запросов конкретных библиотек. Поэтому оборачиваются обработчики GET-запросов лишь переданного менеджера, а метод разбора подменяется только у контейнера текущего запроса. Таблица обработчиков является приватной частью **dublib**: при её отсутствии заголовок не запоминается, и условные запросы используют время сохранения записи.
+
+	:param requestor: Менеджер запросов.
+	:type requestor: WebRequestor
+	:return: Возвращает `True`, если запоминание заголовка подключено.
+	:rtype: bool
+	"""
+
+	Methods = getattr(requestor, "_WebRequestor__RequestsMethods", None)
+	if not isinstance(Methods, dict) or not isinstance(Methods.get(RequestsTypes.GET), dict): return False
+
+	def WrapMethod(method: Callable) -> Callable:
+
+		@wraps(method)
+		def CapturingMethod(response: WebResponse, *args, **kwargs):
+			ParseResponse = response.parse_response
+
+			def CapturingParseResponse(library_response, *parse_args, **parse_kwargs):
+				Headers = getattr(library_response, "headers", None)
+				_LastModified.value = Headers.get("Last-Modified") if Headers else None
+
+				return ParseResponse(library_response, *parse_args, **parse_kwargs)
+
+			response.parse_response = CapturingParseResponse
+
+			try: return method(response, *args, **kwargs)
+			finally: del response.parse_response
+
+		CapturingMethod.captures_last_modified = True
+
+		return CapturingMethod
+
+	for Lib, Method in tuple(Methods[RequestsTypes.GET].items()):
+		if not getattr(Method, "captures_last_modified", False): Methods[RequestsTypes.GET][Lib] = WrapMethod(Method)
+
+	return True
+
+#==========================================================================================#
+# >>>>> ОСНОВНЫЕ КЛАССЫ <<<<< #
+#==========================================================================================#
+
+class CachedResponse:
+	"""Сохранённый в кэше ответ, совместимый с разбором ответов библиотек запросов."""
+
+	def __init__(self, status_code: int, content: bytes, text: str):
+		"""
+		Сохранённый в кэше ответ, совместимый с разбором ответов библиотек запросов.
+
+		:param status_code: Код ответа.
+		:type status_code: int
+		:param content: Бинарное представление ответа.
+		:type content: bytes
+		:param text: Текстовое представление ответа.
+		:type text: str
+		"""
+
+		self.status_code = status_code
+		self.content = content
+		self.text = text
+
+class ResponsesCache:
+	"""
+	Дисковый кэш ответов на GET-запросы с повторной проверкой актуальности через заголовок `If-Modified-Since`.
+
+	Проверка актуальности основана только на времени: `ETag` и `Cache-Control` не учитываются, а при отсутствии у сервера заголовка `Last-Modified` в условном запросе передаётся время сохранения записи, поэтому источники без поддержки условных запросов отдают ответ целиком, а источники с неточными часами могут вернуть код _304_ для изменившегося ресурса.
+	"""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def directory(self) -> PathLike:
+		"""Путь к каталогу кэша."""
+
+		return self.__Directory
+
+	@property
+	def ttl(self) -> float:
+		"""Время в секундах, в течение которого сохранённый ответ используется без обращения к источнику."""
+
+		return self.__TTL
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __GetPath(self, requestor: WebRequestor, url: str, params: dict | None, headers: dict | None, cookies: dict | None) -> str:
+		"""
+		Возвращает путь к файлу записи кэша. Ключом записи служат метод, адрес, параметры запроса, итоговые заголовки и cookies, так что ответы для разных учётных записей или языков не смешиваются.
+
+		:param requestor: Менеджер запросов.
+		:type requestor: WebRequestor
+		:param url: Адрес запроса.
+		:type url: str
+		:param params: Словарь параметров запроса.
+		:type params: dict | None
+		:param headers: Словарь заголовков запроса.
+		:type headers: dict | None
+		:param cookies: Словарь cookies запроса.
+		:type cookies: dict | None
+		:return: Путь к файлу записи.
+		:rtype: str
+		"""
+
+		Headers = {Key.lower(): Value for Key, Value in ((requestor.config.headers or dict()) | (headers or dict())).items()}
+		Cookies = (requestor.cookies or dict()) | (cookies or dict())
+		Request = json.dumps({"params": params, "headers": Headers, "cookies": Cookies}, sort_keys = True, default = str)
+		Key = hashlib.sha256(f"GET\n{url}\n{Request}".encode()).hexdigest()
+
+		return f"{self.__Directory}/{Key[:2]}/{Key}"
+
+	def __Read(self, path: str) -> tuple[dict, CachedResponse] | None:
+		"""
+		Считывает запись кэша.
+
+		:param path: Путь к файлу записи.
+		:type path: str
+		:return: Метаданные записи и сохранённый ответ или `None`, если запись отсутствует либо повреждена. Временем последней проверки актуальности записи служит время модификации файла.
+		:rtype: tuple[dict, CachedResponse] | None
+		"""
+
+		try:
+			with open(path, "rb") as FileReader:
+				Metadata = json.loads(FileReader.readline())
+				Content = FileReader.read()
+				Metadata["time"] = os.fstat(FileReader.fileno()).st_mtime
+
+		except (OSError, ValueError): return None
+
+		Text = Metadata["text"] if "text" in Metadata else Content.decode()
+
+		return Metadata, CachedResponse(Metadata["status_code"], Content, Text)
+
+	def __Request(self, request: Callable[..., WebResponse], requestor: WebRequestor, url: str, **kwargs) -> WebResponse:
+		"""
+		Выполняет GET-запрос с использованием кэша. Свежая запись возвращается без обращения к источнику, устаревшая перепроверяется условным запросом, а успешные ответы сохраняются.
+
+		:param request: Исходный обработчик запросов менеджера.
+		:type request: Callable[..., WebResponse]
+		:param requestor: Менеджер запросов.
+		:type requestor: WebRequestor
+		:param url: Адрес запроса.
+		:type url: str
+		:param kwargs: Именованные аргументы запроса.
+		:return: Унифицированный контейнер ответа на веб-запросы.
+		:rtype: WebResponse
+		"""
+
+		Path = self.__GetPath(requestor, url, kwargs.get("params"), kwargs.get("headers"), kwargs.get("cookies"))
+		Record = self.__Read(Path)
+
+		if Record and time() - Record[0]["time"] < self.__TTL:
+			Response = WebResponse(requestor.config)
+			Response.parse_response(Record[1])
+
+			return Response
+
+		if Record:
+			LastModified = Record[0].get("last_modified") or formatdate(Record[0]["time"], usegmt = True)
+			kwargs["headers"] = (kwargs.get("headers") or dict()) | {"If-Modified-Since": LastModified}
+
+		_LastModified.value = None
+		Response: WebResponse = request(RequestsTypes.GET, url, **kwargs)
+
+		if Response.status_code == 304 and Record:
+			self.__Touch(Path)
+			Response = WebResponse(requestor.config)
+			Response.parse_response(Record[1])
+
+		elif Response.status_code == 200 and Response.content != None:
+			self.__Write(Path, url, Response.content, Response.text or "", _LastModified.value)
+
+		return Response
+
+	def __Touch(self, path: str):
+		"""
+		Обновляет время проверки актуальности записи кэша.
+
+		:param path: Путь к файлу записи.
+		:type path: str
+		"""
+
+		try: os.utime(path)
+		except OSError: pass
+
+	def __Write(self, path: str, url: str, content: bytes, text: str, last_modified: str | None = None):
+		"""
+		Атомарно записывает запись кэша.
+
+		:param path: Путь к файлу записи.
+		:type path: str
+		:param url: Адрес запроса.
+		:type url: str
+		:param content: Бинарное представление ответа.
+		:type content: bytes
+		:param text: Текстовое представление ответа.
+		:type text: str
+		:param last_modified: Значение заголовка `Last-Modified` ответа сервера.
+		:type last_modified: str | None
+		"""
+
+		Metadata = {"url": url, "status_code": 200}
+		if text.encode() != content: Metadata["text"] = text
+		if last_modified: Metadata["last_modified"] = last_modified
+
+		os.makedirs(os.path.dirname(path), exist_ok = True)
+		TempPath = f"{path}.{os.getpid()}-{get_ident()}.tmp"
+
+		with open(TempPath, "wb") as FileWriter:
+			FileWriter.write(json.dumps(Metadata, ensure_ascii = False).encode() + b"\n")
+			FileWriter.write(content)
+
+		os.replace(TempPath, path)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, directory: PathLike, ttl: float):
+		"""
+		Дисковый кэш ответов на GET-запросы с повторной проверкой актуальности через заголовок `If-Modified-Since`.
+
+		:param directory: Путь к каталогу кэша.
+		:type directory: PathLike
+		:param ttl: Время в секундах, в течение которого сохранённый ответ используется без обращения к источнику. По его истечении ответ перепроверяется условным запросом.
+		:type ttl: float
+		"""
+
+		self.__Directory = directory
+		self.__TTL = max(float(ttl), 0.0)
+
+		self.__Bypass = local()
+
+	def bind(self, requestor: WebRequestor) -> WebRequestor:
+		"""
+		Подключает кэш к менеджеру запросов. Код _304_ добавляется к успешным, чтобы ответ на условный запрос не считался ошибкой и не повторялся, а ответы этого менеджера начинают сообщать заголовок `Last-Modified`.
+
+		:param requestor: Менеджер запросов.
+		:type requestor: WebRequestor
+		:return: Тот же менеджер запросов.
+		:rtype: WebRequestor
+		"""
+
+		Request = requestor.request
+		if getattr(Request, "responses_cache", None) is self: return requestor
+		if 304 not in requestor.config.good_codes: requestor.config.set_good_codes(tuple(requestor.config.good_codes) + (304,))
+		_CaptureLastModified(requestor)
+
+		@wraps(Request)
+		def CachedRequest(request_type: RequestsTypes, url: str, **kwargs):
+			if request_type != RequestsTypes.GET or getattr(self.__Bypass, "status", False): return Request(request_type, url, **kwargs)
+			return self.__Request(Request, requestor, url, **kwargs)
+
+		CachedRequest.responses_cache = self
+		requestor.request = CachedRequest
+
+		return requestor
+
+	@contextmanager
+	def bypass(self) -> Iterator[None]:
+		"""Контекстный менеджер, в рамках которого запросы текущего потока выполняются без участия кэша."""
+
+		PreviousStatus = getattr(self.__Bypass, "status", False)
+		self.__Bypass.status = True
+
+		try: yield
+		finally: self.__Bypass.status = PreviousStatus
+
+	def clear(self):
+		"""Удаляет все записи кэша."""
+
+		if os.path.exists(self.__Directory): shutil.rmtree(self.__Directory)
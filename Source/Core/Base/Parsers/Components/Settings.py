@@ -1,3 +1,4 @@
+from Source.Core.Base.Formats.Components.Functions import IsCompressionAvailable
 from Source.Core.SystemObjects.Logger import Logger
 from Source.Core.Exceptions import BadSettings
 
@@ -25,7 +26,14 @@ Settings = MappingProxyType({
 		"use_id_as_filename": False,
 		"sizing_images": True,
 		"retries": 1,
-		"delay": 1
+		"delay": 1,
+		"amending_workers": 4,
+		"sharded_storage": False,
+		"compression": "",
+		"deduplicate_images": False,
+		"store_slides": False,
+		"http_cache_ttl": None,
+		"pool_size": None
 	},
 	"filters": {
 		"text_regexs": [],
@@ -163,13 +171,25 @@ class ImageFilters:
 		:rtype: bool
 		"""
 
-		Hash = None
+		if not self.md5: return False
+		Hash = hashlib.md5()
 		
 		with open(path, "rb") as FileReader: 
-			BinaryContent = FileReader.read()
-			Hash = hashlib.md5(BinaryContent).hexdigest()
+			for Chunk in iter(lambda: FileReader.read(1048576), b""): Hash.update(Chunk)
 
-		return Hash in self.md5
+		return self.check_md5(Hash.hexdigest())
+
+	def check_md5(self, md5: str | None) -> bool:
+		"""
+		Проверяет, находится ли MD5-хэш изображения в чёрном списке. Позволяет не считывать файл повторно, если хэш уже вычислен при скачивании (см. `ImageDownloadingStatus.md5`).
+
+		:param md5: MD5-хэш в шестнадцатеричном представлении.
+		:type md5: str | None
+		:return: Возвращает `True`, если хеш изображения найден в чёрном списке.
+		:rtype: bool
+		"""
+
+		return bool(md5) and md5.lower() in self.md5
 
 	def check_sizes(self, width: int, height: int) -> bool:
 		"""
@@ -257,6 +277,48 @@ class Common:
 
 		return self.__Settings["delay"]
 
+	@property
+	def amending_workers(self) -> int:
+		"""Максимальное количество глав, дополняемых одновременно парсерами с поддержкой параллельного дополнения."""
+
+		return self.__Settings["amending_workers"]
+
+	@property
+	def sharded_storage(self) -> bool:
+		"""Указывает, нужно ли хранить главы каждой ветви в отдельном шарде."""
+
+		return self.__Settings["sharded_storage"]
+
+	@property
+	def compression(self) -> str | None:
+		"""Алгоритм сжатия описательных файлов. Сжатые файлы сохраняют расширение _.json_, так как по нему тайтлы находят каталог, журнал, коллектор и шарды; алгоритм определяется по сигнатуре содержимого."""
+
+		return self.__Settings["compression"]
+
+	@property
+	def deduplicate_images(self) -> bool:
+		"""Указывает, нужно ли хранить изображения в общем хранилище с адресацией по хэшу содержимого."""
+
+		return self.__Settings["deduplicate_images"]
+
+	@property
+	def store_slides(self) -> bool:
+		"""Указывает, нужно ли сохранять скачанные при сборке слайды в каталог изображений тайтла для повторного использования."""
+
+		return self.__Settings["store_slides"]
+
+	@property
+	def http_cache_ttl(self) -> float | None:
+		"""Время в секундах, в течение которого ответы источника берутся из дискового кэша без перепроверки. При значении `None` кэш отключён."""
+
+		return self.__Settings["http_cache_ttl"]
+
+	@property
+	def pool_size(self) -> int | None:
+		"""Максимальное количество поддерживаемых соединений к одному хосту в разделяемой сессии парсера. Применяется только к библиотеке **requests**; при значении `None` используется размер пула по умолчанию."""
+
+		return self.__Settings["pool_size"]
+
 	#==========================================================================================#
 	# >>>>> МЕТОДЫ <<<<< #
 	#==========================================================================================#
@@ -304,7 +366,14 @@ class Common:
 			"use_id_as_filename": False,
 			"sizing_images": True,
 			"retries": 0,
-			"delay": 1.0
+			"delay": 1.0,
+			"amending_workers": 4,
+			"sharded_storage": False,
+			"compression": None,
+			"deduplicate_images": False,
+			"store_slides": False,
+			"http_cache_ttl": None,
+			"pool_size": None
 		}
 
 		if "common" in settings.keys():
@@ -320,6 +389,27 @@ class Common:
 
 			elif not self.__Settings["bad_image_stub"]: self.__Settings["bad_image_stub"] = None
 
+			if not self.__Settings["compression"]: self.__Settings["compression"] = None
+
+			elif not IsCompressionAvailable(self.__Settings["compression"]):
+				logger.error(f"Compression \"{self.__Settings['compression']}\" is unknown or requires missing package.")
+				raise BadSettings(parser_name)
+
+			if self.__Settings["http_cache_ttl"] != None:
+
+				try: self.__Settings["http_cache_ttl"] = max(float(self.__Settings["http_cache_ttl"]), 0.0)
+				except (TypeError, ValueError):
+					logger.error("HTTP cache TTL must be number or null.")
+					raise BadSettings(parser_name)
+
+			for Key in ("amending_workers", "pool_size"):
+				Value = self.__Settings[Key]
+				if Key == "pool_size" and Value == None: continue
+
+				if type(Value) != int or Value < 1:
+					logger.error(f"Option \"{Key}\" must be positive integer.")
+					raise BadSettings(parser_name)
+
 			self.__PutDefaultDirectories(parser_name)
 
 		else: raise BadSettings(parser_name)
@@ -343,6 +433,15 @@ class Directories:
 
 		return self.__Common.images_directory
 	
+	@property
+	def images_store(self) -> PathLike:
+		"""Директория хранилища изображений с адресацией по хэшу содержимого. Если таковой нет, то создаёт её."""
+
+		Directory = self.__Common.images_directory + "/.store"
+		if not os.path.exists(Directory): os.makedirs(Directory)
+
+		return Directory
+
 	@property
 	def titles(self) -> str:
 		"""Директория описательных файлов."""
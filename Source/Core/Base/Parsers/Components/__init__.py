@@ -1,3 +1,6 @@
 from .ImagesDownloader import ImagesDownloader
+from .ImagesStore import ImagesStore
+from .ResponsesCache import ResponsesCache
+from .RateLimiter import RateLimiter
 from .Settings import ParserSettings
 from .Manifest import ParserManifest
\ No newline at end of file
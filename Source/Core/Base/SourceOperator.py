@@ -1,9 +1,12 @@
 from Source.Core.Base.Parsers.Components.ImagesDownloader import ImageDownloadingStatus, ImagesDownloader
+from Source.Core.Base.Parsers.Components.ResponsesCache import ResponsesCache
+from Source.Core.Base.Parsers.Components.RateLimiter import RateLimiter
 
 from dublib.WebRequestor import WebConfig, WebLibs, WebRequestor
 from dublib.Engine.Bus import ExecutionStatus
 	
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
+from os import PathLike
 
 if TYPE_CHECKING:
 	from .EntryPoint import BaseEntryPoint
@@ -29,6 +32,18 @@ class BaseSourceOperator:
 
 		return self._Manifest
 
+	@property
+	def rate_limiter(self) -> RateLimiter:
+		"""Ограничитель частоты запросов к источнику."""
+
+		return self._RateLimiter
+
+	@property
+	def responses_cache(self) -> ResponsesCache | None:
+		"""Дисковый кэш ответов источника или `None`, если кэширование отключено."""
+
+		return self._ResponsesCache
+
 	@property
 	def settings(self) -> "ParserSettings":
 		"""Настройки парсера."""
@@ -89,8 +104,19 @@ class BaseSourceOperator:
 		self._Settings = entry_point.settings
 		self._Manifest = entry_point.manifest
 
-		self._Requestor = self._InitializeRequestor()
-		self._ImagesDownloader = ImagesDownloader(self._SystemObjects, self._Requestor)
+		Sessions = self._SystemObjects.sessions
+		self._Requestor = Sessions.get_requestor(self._Manifest.name)
+		if not self._Requestor: self._Requestor = Sessions.register(self._Manifest.name, self._InitializeRequestor(), self._Settings.common.pool_size)
+
+		self._RateLimiter = getattr(self._Requestor.request, "rate_limiter", None) or RateLimiter(self._Settings.common.delay)
+		self._RateLimiter.bind(self._Requestor)
+		self._ResponsesCache = getattr(self._Requestor.request, "responses_cache", None)
+
+		if not self._ResponsesCache and self._Settings.common.http_cache_ttl != None:
+			self._ResponsesCache = ResponsesCache(f"{self._Temper.shared_data.path}/http_cache", self._Settings.common.http_cache_ttl)
+			self._ResponsesCache.bind(self._Requestor)
+
+		self._ImagesDownloader = ImagesDownloader(self._SystemObjects, self._Requestor, self._RateLimiter)
 
 		self._PostInitMethod()
 
@@ -121,4 +147,26 @@ class BaseSourceOperator:
 		:rtype: ImageDownloadingStatus
 		"""
 		
-		return self._ImagesDownloader.temp_image(url)
\ No newline at end of file
+		return self._ImagesDownloader.temp_image(url)
+
+	def images(self, urls: Iterable[str], directory: PathLike | None = None, workers: int | None = None) -> list[ImageDownloadingStatus]:
+		"""
+		Одновременно скачивает несколько изображений, вызывая для каждой ссылки метод `image()`. При указании каталога скачанные файлы перемещаются в него под теми же именами.
+
+		:param urls: Последовательность ссылок на изображения.
+		:type urls: Iterable[str]
+		:param directory: Путь к каталогу, в который нужно сохранить файлы. По умолчанию файлы остаются во временном каталоге парсера.
+		:type directory: PathLike | None
+		:param workers: Максимальное количество одновременных загрузок. По умолчанию равно размеру пула соединений из настроек парсера.
+		:type workers: int | None
+		:return: Список статусов скачивания в порядке следования ссылок.
+		:rtype: list[ImageDownloadingStatus]
+		"""
+
+		def Download(url: str) -> ImageDownloadingStatus:
+			Status = self.image(url)
+			if directory and Status.code == 200 and Status.value: self._ImagesDownloader.move_from_temp(directory, Status.value)
+
+			return Status
+
+		return self._ImagesDownloader.batch(Download, urls, workers)
@@ -1,5 +1,3 @@
-from Source.Core.Base.Formats.Components.Functions import SafelyReadTitleJSON
-
 from dublib.Engine.Bus import ExecutionStatus
 
 from typing import TYPE_CHECKING
@@ -24,7 +22,7 @@ class Cacher:
 
 	def cache_parser_output(self, parser_name: str) -> ExecutionStatus:
 		"""
-		Кэширует пары ID-алиас файлов в выходном каталоге парсера.
+		Кэширует пары ID-алиас файлов в выходном каталоге парсера. Описательные файлы индексируются в каталоге парсера, при этом повторно считываются только изменённые с прошлого запуска файлы. Для доступа к каталогу и журналу парсер выбирается в общем дескрипторе временных файлов.
 
 		:param parser_name: Имя парсера.
 		:type parser_name: str
@@ -45,33 +43,31 @@ class Cacher:
 		Status["errors"] = list()
 
 		ParserSettings = self.__Controller.get_parser_settings(parser_name)
-		Files = list()
-
 		if not os.path.exists(ParserSettings.directories.titles): return Status
 
-		for Element in os.scandir(ParserSettings.directories.titles):
-			if not Element.is_file() or not Element.name.endswith(".json"): continue
-			else: Files.append(Element.name[:-5])
-
-		Files = tuple(Files)
-		Status["total"] = len(Files)
+		self.__Temper.select_parser(parser_name)
+		Catalog = self.__Temper.shared_data.catalog
+		Journal = self.__Temper.shared_data.journal
 
-		for CurrentFile in Files:
+		Catalog.refresh(ParserSettings.directories.titles)
+		Pairs = Catalog.get_pairs()
+		Status["total"] = len(Pairs)
+		Status["errors"] = list(Catalog.get_errors())
+		Status["total"] += len(Status["errors"])
 
-			try:
-				Data = SafelyReadTitleJSON(f"{ParserSettings.directories.titles}/{CurrentFile}.json")
+		for ID, Slug in Pairs:
 
-				if self.__Temper.shared_data.journal.get_slug_by_id(Data["id"]):
-					Status["in_cache"] += 1
+			if type(ID) != int or type(Slug) != str:
+				Status["errors"].append(Catalog.get_filename_by_id(ID))
 
-				else:
-					self.__Temper.shared_data.journal.update(Data["id"], Data["slug"])
-					Status["cached"] += 1
+			elif Journal.get_slug_by_id(ID) == Slug:
+				Status["in_cache"] += 1
 
-			except:
-				Status["errors"].append(CurrentFile)
-				continue
+			else:
+				Journal.update(ID, Slug)
+				Status["cached"] += 1
 
+		self.__Temper.close()
 		Status["errors"] = tuple(Status["errors"])
 
-		return Status
\ No newline at end of file
+		return Status
@@ -1,10 +1,10 @@
+from Source.Core.Base.Formats.Components.Functions import ReadTitleHeaders
 from Source.Core.Base.Formats.Components.Enums import By
 from Source.Core.SystemObjects import SystemObjects
 
-from dublib.Methods.Filesystem import ReadJSON
 from dublib.Methods.Data import ToIterable
 
-from typing import Iterable
+from typing import Iterable, Iterator
 import os
 
 class Collector:
@@ -18,27 +18,16 @@ class Collector:
 	def slugs(self) -> list[str]:
 		"""Список алиасов в коллекции."""
 
-		return self.__Collection
+		return list(self.__Collection)
 
 	#==========================================================================================#
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
-	def __ReadCollection(self) -> list[str]:
-		"""Читает коллекцию."""
+	def __ReadCollection(self) -> dict[str, None]:
+		"""Читает коллекцию в упорядоченное множество алиасов."""
 
-		Collection = list()
-		
-		if os.path.exists(self.__Path):
-			
-			with open(self.__Path, "r") as FileReader:
-				Buffer = FileReader.read().split("\n")
-
-				for Line in Buffer:
-					Line = Line.strip()
-					if Line: Collection.append(Line)
-
-		return Collection
+		return dict.fromkeys(self.iterate())
 
 	#==========================================================================================#
 	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
@@ -59,57 +48,95 @@ class Collector:
 		self.__SystemObjects = system_objects
 
 		self.__Path = f"{system_objects.temper.parser_temp}/Collection.txt"
-		self.__Collection = self.__ReadCollection() if merge else list()
+		self.__Collection: dict[str, None] = self.__ReadCollection() if merge else dict()
 
 	def append(self, slugs: str | Iterable[str]):
 		"""
-		Добавляет один или несколько алиасов в коллекцию.
+		Добавляет один или несколько алиасов в коллекцию. Уже присутствующие алиасы сохраняют свою позицию.
 
 		:param slugs: Добавляемые алиасы.
 		:type slugs: str | Iterable[str]
 		"""
 
-		slugs = ToIterable(slugs)
-		self.__Collection += [Slug for Slug in slugs if Slug not in self.__Collection]
+		for Slug in ToIterable(slugs): self.__Collection[Slug] = None
+
+	def count(self) -> int:
+		"""
+		Потоково подсчитывает количество алиасов в файле коллекции.
+
+		:return: Количество непустых строк файла коллекции.
+		:rtype: int
+		"""
+
+		if not os.path.exists(self.__Path): return 0
+
+		with open(self.__Path, "rb") as FileReader: return sum(1 for Line in FileReader if Line.strip())
 
 	def get_local_identificators(self, identificator_type: By) -> list[int] | list[str]:
 		"""
-		Сканирует директорию и возвращает список идентификаторов тайтлов.
-			identificator_type – тип идентификаторов в спике.
+		Сканирует директорию и возвращает список идентификаторов тайтлов. При включённом кэшировании ID и алиасы берутся из каталога описательных файлов, иначе считываются только заголовки файлов.
+
+		:param identificator_type: Тип идентификаторов в списке.
+		:type identificator_type: By
+		:return: Список идентификаторов тайтлов.
+		:rtype: list[int] | list[str]
 		"""
 		
 		ParserSettings = self.__SystemObjects.controller.current_parser_settings
+		Directory = ParserSettings.common.titles_directory
+		LocalTitles = [Entry.name for Entry in os.scandir(Directory) if Entry.is_file() and Entry.name.endswith(".json")]
+		if identificator_type == By.Filename: return [Filename[:-5] for Filename in LocalTitles]
 
-		LocalTitles = [Entry.name for Entry in os.scandir(ParserSettings.common.titles_directory) if Entry.is_file() and Entry.name.endswith(".json")]
-		Identificators = list()
+		if self.__SystemObjects.CACHING:
+			Catalog = self.__SystemObjects.temper.shared_data.catalog
+			Catalog.refresh(Directory)
 
-		for Filename in LocalTitles:
+			return Catalog.get_values(identificator_type.value)
 
-			try:
-				if identificator_type == By.Filename:
-					Identificators.append(Filename[:-5])
+		Headers = ReadTitleHeaders(f"{Directory}/{Filename}" for Filename in LocalTitles)
+
+		return [Header[identificator_type.value] for Header in Headers if Header and identificator_type.value in Header]
+
+	def index(self, slug: str) -> int | None:
+		"""
+		Потоково ищет позицию алиаса в файле коллекции.
+
+		:param slug: Алиас тайтла.
+		:type slug: str
+		:return: Индекс алиаса или `None` при его отсутствии.
+		:rtype: int | None
+		"""
+
+		for Index, Slug in enumerate(self.iterate()):
+			if Slug == slug: return Index
+
+	def iterate(self) -> Iterator[str]:
+		"""
+		Построчно читает файл коллекции, не загружая его в память целиком. Повторы не отбрасываются, так как коллекция записывается без них.
+
+		:return: Генератор алиасов в порядке следования в файле.
+		:rtype: Iterator[str]
+		"""
 
-				elif identificator_type in [By.ID, By.Slug]:
-					Title = ReadJSON(f"{ParserSettings.common.titles_directory}/{Filename}") 
-					Identificators.append(Title[identificator_type.value])
+		if not os.path.exists(self.__Path): return
 
-			except KeyError: pass
+		with open(self.__Path, "r") as FileReader:
 
-		return Identificators
+			for Line in FileReader:
+				Line = Line.strip()
+				if Line: yield Line
 
 	def save(self, sort: bool = False):
 		"""
-		Сохраняет коллекцию в файл.
+		Сохраняет коллекцию в файл. Без сортировки алиасы записываются в порядке добавления.
 
 		:param sort: Указывает, требуется ли сортировка по алфавиту.
 		:type sort: bool
 		"""
 
-		self.__Collection = list(set(self.__Collection))
-		if sort: self.__Collection = sorted(self.__Collection)
+		Collection = sorted(self.__Collection) if sort else self.__Collection
 
-		with open(self.__Path, "w") as FileWriter:
-			for Slug in self.__Collection: FileWriter.write(Slug + "\n")
+		with open(self.__Path, "w") as FileWriter: FileWriter.writelines(Slug + "\n" for Slug in Collection)
 
 	def from_local(self) -> int:
 		"""Сканирует директорию тайтлов и сторит из неё коллекцию."""
@@ -0,0 +1,104 @@
+from Source.Core.Base.Formats.Components.Functions import GetTitleFileCompression, IsShardedTitle, JoinTitleShards, ReadTitleJSON, RemoveTitleShards, WriteShardedTitle, WriteTitleJSON
+
+from dublib.Engine.Bus import ExecutionStatus
+
+from typing import TYPE_CHECKING
+import os
+
+if TYPE_CHECKING:
+	from Source.Core.SystemObjects import SystemObjects
+
+class Converter:
+	"""Оператор преобразования способа хранения и сжатия описательных файлов."""
+
+	def __init__(self, system_objects: "SystemObjects"):
+		"""
+		Оператор преобразования способа хранения и сжатия описательных файлов.
+
+		:param system_objects: Коллекция системных объектов.
+		:type system_objects: SystemObjects
+		"""
+
+		self.__Controller = system_objects.controller
+
+	def convert_file(self, path: str, sharded: bool | None = None, compression: str | None = None) -> bool:
+		"""
+		Преобразует описательный файл.
+
+		:param path: Путь к описательному файлу.
+		:type path: str
+		:param sharded: Указывает, нужно ли вынести главы в шарды (`True`) или встроить их в файл (`False`). При `None` способ хранения не меняется.
+		:type sharded: bool | None
+		:param compression: Алгоритм сжатия: _gzip_, _zstd_ или _none_ для хранения без сжатия. При `None` сжатие не меняется.
+		:type compression: str | None
+		:return: Возвращает `True`, если файл был преобразован, и `False`, если он уже хранится нужным образом.
+		:rtype: bool
+		"""
+
+		Data = ReadTitleJSON(path)
+		IsSharded = IsShardedTitle(Data)
+		CurrentCompression = GetTitleFileCompression(path)
+		if sharded == None: sharded = IsSharded
+		if compression == None: compression = CurrentCompression
+		elif compression == "none": compression = None
+		if (IsSharded, CurrentCompression) == (sharded, compression): return False
+
+		if IsSharded: Data = JoinTitleShards(path, Data)
+
+		if sharded:
+			WriteShardedTitle(path, Data, compression)
+
+		else:
+			WriteTitleJSON(path, Data, compression)
+			RemoveTitleShards(path)
+
+		return True
+
+	def convert_parser_output(self, parser_name: str, sharded: bool | None = None, compression: str | None = None, filename: str | None = None) -> ExecutionStatus:
+		"""
+		Преобразует описательные файлы в выходном каталоге парсера.
+
+		:param parser_name: Имя парсера.
+		:type parser_name: str
+		:param sharded: Указывает, нужно ли вынести главы в шарды (`True`) или встроить их в файл (`False`). При `None` способ хранения не меняется.
+		:type sharded: bool | None
+		:param compression: Алгоритм сжатия: _gzip_, _zstd_ или _none_ для хранения без сжатия. При `None` сжатие не меняется.
+		:type compression: str | None
+		:param filename: Имя единственного преобразуемого файла без расширения.
+		:type filename: str | None
+		:return: Результат преобразования, в котором доступны ключи:
+
+			* _total_ – всего найдено файлов;
+			* _skipped_ – из них уже хранились нужным образом;
+			* _converted_ – преобразовано;
+			* _errors_ – последовательность имён файлов (без расширения), в которых возникли ошибки.
+
+		:rtype: ExecutionStatus
+		"""
+
+		Status = ExecutionStatus()
+		Status["total"] = 0
+		Status["skipped"] = 0
+		Status["converted"] = 0
+		Status["errors"] = list()
+
+		Directory = self.__Controller.get_parser_settings(parser_name).directories.titles
+		if not os.path.exists(Directory): return Status
+
+		if filename: Files = (filename,)
+		else: Files = tuple(Element.name[:-5] for Element in os.scandir(Directory) if Element.is_file() and Element.name.endswith(".json"))
+		Status["total"] = len(Files)
+
+		for CurrentFile in Files:
+
+			try:
+				if self.convert_file(f"{Directory}/{CurrentFile}.json", sharded, compression): Status["converted"] += 1
+				else: Status["skipped"] += 1
+
+			except:
+				Status["errors"].append(CurrentFile)
+				continue
+
+		Status["errors"] = tuple(Status["errors"])
+
+		return Status
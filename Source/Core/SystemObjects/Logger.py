@@ -8,6 +8,7 @@ from dublib.WebRequestor import WebResponse
 
 from typing import TYPE_CHECKING
 from datetime import datetime
+from threading import local
 import logging
 import enum
 import sys
@@ -466,6 +467,20 @@ class Logger:
 	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
 	#==========================================================================================#
 
+	def __AddThreadPrefix(self, text: str) -> str:
+		"""
+		Добавляет к тексту префикс текущего потока, если тот задан.
+
+		:param text: Текст сообщения.
+		:type text: str
+		:return: Текст сообщения с префиксом.
+		:rtype: str
+		"""
+
+		Prefix = getattr(self.__ThreadData, "prefix", None)
+
+		return f"[{Prefix}] {text}" if Prefix else text
+
 	def __ReadSettings(self) -> LoggerSettings:
 		"""
 		Считвает настройки логов для конкретного парсера.
@@ -508,7 +523,7 @@ class Logger:
 		:type message_type: MessagesTypes | None
 		"""
 
-		text = self.__ReplaceTags(text)
+		text = self.__ReplaceTags(self.__AddThreadPrefix(text))
 
 		match message_type:
 
@@ -540,7 +555,7 @@ class Logger:
 		:type message_type: MessagesTypes | None
 		"""
 
-		text = GetStyledTextFromHTML(text)
+		text = GetStyledTextFromHTML(self.__AddThreadPrefix(text))
 		PrintMessage(text, message_type)
 
 	def __SendReport(self, description: str):
@@ -612,6 +627,7 @@ class Logger:
 		self.__LoggerRule = LoggerRules.SaveIfHasWarnings
 		self.__IsLogHasError = False
 		self.__IsLogHasWarning = False
+		self.__ThreadData = local()
 
 		#---> Настройка логов.
 		#==========================================================================================#
@@ -653,6 +669,16 @@ class Logger:
 		if type(rule) == int: self.__LoggerRule = LoggerRules(rule)
 		else: self.__LoggerRule = rule
 
+	def set_thread_prefix(self, prefix: str | None):
+		"""
+		Задаёт префикс сообщений, выводимых из текущего потока. Используется для различения вывода параллельно обрабатываемых тайтлов.
+
+		:param prefix: Префикс сообщений, например алиас тайтла. Значение `None` отключает префикс.
+		:type prefix: str | None
+		"""
+
+		self.__ThreadData.prefix = prefix
+
 	#==========================================================================================#
 	# >>>>> БАЗОВЫЕ МЕТОДЫ ВЫВОДА <<<<< #
 	#==========================================================================================#
@@ -0,0 +1,122 @@
+from Source.Core.SystemObjects.Logger import Logger
+
+from dublib.WebRequestor import WebLibs, WebRequestor
+
+from requests.adapters import HTTPAdapter
+from threading import Lock
+
+DEFAULT_POOL_SIZE = 16
+
+class Sessions:
+	"""Менеджер разделяемых HTTP-сессий. Каждому владельцу (парсеру или расширению) выдаётся единственный оператор запросов, чей пул соединений переиспользуется всеми компонентами."""
+
+	#==========================================================================================#
+	# >>>>> СВОЙСТВА <<<<< #
+	#==========================================================================================#
+
+	@property
+	def owners(self) -> tuple[str]:
+		"""Последовательность владельцев зарегистрированных операторов запросов."""
+
+		with self.__Locker: return tuple(self.__Requestors.keys())
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __TunePool(self, requestor: WebRequestor, pool_size: int) -> bool:
+		"""
+		Задаёт размер пула соединений к одному хосту для сессии оператора запросов. Настраивается только сессия библиотеки **requests**: к ней подключаются адаптеры с увеличенным пулом, а сама сессия вместе с cookies и прочими параметрами сохраняется. Для **httpx** dublib создаёт клиент заново при каждом запросе, а сессия **curl_cffi** хранит параметры имитации браузера, поэтому их настройка не поддерживается. Поскольку dublib не предоставляет публичного доступа к сессии, она получается по внутреннему имени атрибута; при его отсутствии настройка также не выполняется.
+
+		:param requestor: Оператор запросов.
+		:type requestor: WebRequestor
+		:param pool_size: Максимальное количество поддерживаемых соединений к одному хосту.
+		:type pool_size: int
+		:return: Возвращает `True`, если пул соединений настроен.
+		:rtype: bool
+		"""
+
+		if requestor.config.lib != WebLibs.requests: return False
+		Session = getattr(requestor, "_WebRequestor__Session", None)
+		if not callable(getattr(Session, "mount", None)): return False
+
+		Adapter = HTTPAdapter(pool_connections = pool_size, pool_maxsize = pool_size)
+		Session.mount("https://", Adapter)
+		Session.mount("http://", Adapter)
+
+		return True
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, logger: Logger):
+		"""
+		Менеджер разделяемых HTTP-сессий. Каждому владельцу (парсеру или расширению) выдаётся единственный оператор запросов, чей пул соединений переиспользуется всеми компонентами.
+
+		:param logger: Менеджер логов.
+		:type logger: Logger
+		"""
+
+		self.__Logger = logger
+
+		self.__Requestors: dict[str, WebRequestor] = dict()
+		self.__Locker = Lock()
+
+	def close(self, owner: str | None = None):
+		"""
+		Закрывает сессии.
+
+		:param owner: Владелец закрываемой сессии. По умолчанию закрываются все сессии.
+		:type owner: str | None
+		"""
+
+		with self.__Locker:
+			Owners = (owner,) if owner else tuple(self.__Requestors.keys())
+
+			for Owner in Owners:
+				Requestor = self.__Requestors.pop(Owner, None)
+
+				try:
+					if Requestor: Requestor.close()
+
+				except Exception: pass
+
+	def get_requestor(self, owner: str) -> WebRequestor | None:
+		"""
+		Возвращает зарегистрированный оператор запросов.
+
+		:param owner: Владелец оператора запросов, например имя парсера.
+		:type owner: str
+		:return: Оператор запросов или `None`, если таковой не зарегистрирован.
+		:rtype: WebRequestor | None
+		"""
+
+		with self.__Locker: return self.__Requestors.get(owner)
+
+	def register(self, owner: str, requestor: WebRequestor, pool_size: int | None = None) -> WebRequestor:
+		"""
+		Регистрирует оператор запросов и настраивает пул его соединений. Если для владельца уже зарегистрирован оператор, возвращается он, а переданный закрывается. Если явно заданный размер пула не может быть применён к библиотеке запросов оператора, выводится предупреждение.
+
+		:param owner: Владелец оператора запросов, например имя парсера.
+		:type owner: str
+		:param requestor: Оператор запросов.
+		:type requestor: WebRequestor
+		:param pool_size: Максимальное количество поддерживаемых соединений к одному хосту. При значении `None` используется `DEFAULT_POOL_SIZE`.
+		:type pool_size: int | None
+		:return: Зарегистрированный для владельца оператор запросов.
+		:rtype: WebRequestor
+		"""
+
+		with self.__Locker:
+			Registered = self.__Requestors.get(owner)
+
+			if Registered:
+				if Registered is not requestor: requestor.close()
+				return Registered
+
+			IsTuned = self.__TunePool(requestor, max(int(pool_size or DEFAULT_POOL_SIZE), 1))
+			if not IsTuned and pool_size != None: self.__Logger.warning(f"Option \"pool_size\" is supported only by requests library. Ignored for \"{owner}\".")
+			self.__Requestors[owner] = requestor
+
+		return requestor
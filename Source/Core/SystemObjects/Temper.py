@@ -1,12 +1,53 @@
+from Source.Core.Base.Formats.Components.Functions import GetSupportedFormats, IsShardedTitle, ReadTitleHeaders
 from Source.Core.Exceptions import TempOwnerNotSpecified
 
 from dublib.Methods.Filesystem import ReadJSON, RemoveDirectoryContent, WriteJSON
 
+from threading import RLock
+from time import monotonic
 from typing import Iterable
 from os import PathLike
+import sqlite3
+import atexit
 import shutil
+import stat
 import os
 
+#==========================================================================================#
+# >>>>> ВСПОМОГАТЕЛЬНЫЕ ФУНКЦИИ <<<<< #
+#==========================================================================================#
+
+def _GetDefaultFileMode() -> int:
+	"""
+	Возвращает права доступа, с которыми создаётся новый файл с учётом umask процесса.
+
+	:return: Права доступа.
+	:rtype: int
+	"""
+
+	Umask = os.umask(0o022)
+	os.umask(Umask)
+
+	return 0o666 & ~Umask
+
+DEFAULT_FILE_MODE = _GetDefaultFileMode()
+
+def _WriteJSONAtomically(path: PathLike, data: dict):
+	"""
+	Атомарно записывает JSON. Временный файл атомарной записи dublib создаётся с правами _0600_, поэтому после замены файлу возвращаются прежние права, а новому файлу – права по умолчанию, как при обычной записи.
+
+	:param path: Путь к файлу.
+	:type path: PathLike
+	:param data: Записываемые данные.
+	:type data: dict
+	"""
+
+	try: Mode = stat.S_IMODE(os.stat(path).st_mode)
+	except FileNotFoundError: Mode = DEFAULT_FILE_MODE
+
+	WriteJSON(path, data, atomic = True)
+	os.chmod(path, Mode)
+
 #==========================================================================================#
 # >>>>> ВСПОМОГАТЕЛЬНЫЕ СТРУКТУРЫ ДАННЫХ <<<<< #
 #==========================================================================================#
@@ -14,17 +55,45 @@ import os
 class Journal:
 	"""Журнал хранения пар ID-алиас тайтлов."""
 
-	def __init__(self, shared_data: "SharedData"):
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __BuildReverseIndex(self):
+		"""Строит обратный индекс алиас-ID."""
+
+		self.__Slugs = {Slug: int(ID) for ID, Slug in self.__Data.items()}
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, shared_data: "SharedData", flush_updates_count: int = 1000, flush_interval: float = 5.0):
 		"""
-		Журнал хранения пар ID-алиас тайтлов.
+		Журнал хранения пар ID-алиас тайтлов. Изменения накапливаются в памяти и записываются пакетно.
 
 		:param shared_data: Разделяемые в контексте одного парсера данные.
 		:type shared_data: SharedData
+		:param flush_updates_count: Количество несохранённых изменений, по достижении которого журнал записывается.
+		:type flush_updates_count: int
+		:param flush_interval: Интервал в секундах, по истечении которого с момента последней записи журнал записывается при следующем изменении.
+		:type flush_interval: float
 		"""
 
 		self.__SharedData = shared_data
+		self.__FlushUpdatesCount = max(flush_updates_count, 1)
+		self.__FlushInterval = flush_interval
+
+		self.__Data: dict[str, str] = dict()
+		self.__Slugs: dict[str, int] = dict()
+		self.__UnsavedUpdatesCount = 0
+		self.__LastFlush = monotonic()
+		self.__Locker = RLock()
+
+	def close(self):
+		"""Записывает несохранённые изменения журнала."""
 
-		self.__Data = dict()
+		self.flush()
 
 	def get_id_by_slug(self, slug: str) -> int | None:
 		"""
@@ -34,8 +103,7 @@ class Journal:
 		:type slug: str
 		"""
 
-		for ID, Slug in self.__Data.items():
-			if slug == Slug: return int(ID)
+		return self.__Slugs.get(slug)
 
 	def get_slug_by_id(self, title_id: int) -> str | None:
 		"""
@@ -45,30 +113,44 @@ class Journal:
 		:type slug: str
 		"""
 
-		try: return self.__Data[str(title_id)]
-		except KeyError: pass
+		return self.__Data.get(str(title_id))
 
 	def drop(self):
 		"""Сбрасывает журнал."""
 
-		self.__Data = dict()
-		self.save()
+		with self.__Locker:
+			self.__Data = dict()
+			self.__Slugs = dict()
+			self.save()
+
+	def flush(self):
+		"""Записывает журнал, если в нём есть несохранённые изменения."""
+
+		with self.__Locker:
+			if self.__UnsavedUpdatesCount: self.save()
 
 	def load(self):
 		"""Загружает журнал."""
 
 		Path = f"{self.__SharedData.path}/journal.json"
-		if os.path.exists(Path): self.__Data = ReadJSON(Path)
+
+		with self.__Locker:
+			self.__Data = ReadJSON(Path) if os.path.exists(Path) else dict()
+			self.__BuildReverseIndex()
+			self.__UnsavedUpdatesCount = 0
 
 	def save(self):
 		"""Сохраняет журнал."""
 
-		self.__Data = {Key: self.__Data[Key] for Key in sorted(self.__Data.keys(), key = int)}
-		WriteJSON(f"{self.__SharedData.path}/journal.json", self.__Data)
+		with self.__Locker:
+			self.__Data = {Key: self.__Data[Key] for Key in sorted(self.__Data.keys(), key = int)}
+			_WriteJSONAtomically(f"{self.__SharedData.path}/journal.json", self.__Data)
+			self.__UnsavedUpdatesCount = 0
+			self.__LastFlush = monotonic()
 
 	def update(self, title_id: int, slug: str):
 		"""
-		Обновляет запись об алиасе тайтла.
+		Обновляет запись об алиасе тайтла. Журнал записывается по накоплении заданного количества изменений или по истечении интервала с момента последней записи.
 
 		:param title_id: ID тайтла.
 		:type title_id: int
@@ -79,8 +161,296 @@ class Journal:
 
 		if type(title_id) != int: raise TypeError("Title ID must be integer.")
 		if type(slug) != str: raise TypeError("Title slug must be string.")
-		self.__Data[str(title_id)] = slug
-		self.save()
+
+		with self.__Locker:
+			Key = str(title_id)
+			OldSlug = self.__Data.get(Key)
+			if OldSlug == slug: return
+			if OldSlug != None and self.__Slugs.get(OldSlug) == title_id: del self.__Slugs[OldSlug]
+
+			self.__Data[Key] = slug
+			self.__Slugs[slug] = title_id
+			self.__UnsavedUpdatesCount += 1
+
+			if self.__UnsavedUpdatesCount >= self.__FlushUpdatesCount or monotonic() - self.__LastFlush >= self.__FlushInterval: self.save()
+
+class Catalog:
+	"""Каталог описательных файлов парсера, хранящий основные сведения о тайтлах в базе данных SQLite."""
+
+	#==========================================================================================#
+	# >>>>> ПРИВАТНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __CheckHeader(self, data: dict | None) -> dict | None:
+		"""
+		Проверяет, что заголовок описательного файла содержит поддерживаемый формат.
+
+		:param data: Заголовок описательного файла или `None`, если файл не удалось прочитать.
+		:type data: dict | None
+		:return: Заголовок или `None`, если формат не поддерживается.
+		:rtype: dict | None
+		"""
+
+		if data == None or data.get("format") not in GetSupportedFormats(): return None
+
+		return data
+
+	def __Connect(self) -> sqlite3.Connection:
+		"""
+		Открывает соединение с базой данных каталога, при необходимости создавая таблицу.
+
+		:return: Соединение с базой данных.
+		:rtype: sqlite3.Connection
+		"""
+
+		if not self.__Connection:
+			self.__Connection = sqlite3.connect(f"{self.__SharedData.path}/catalog.sqlite", check_same_thread = False)
+			self.__Connection.executescript("""
+				CREATE TABLE IF NOT EXISTS titles (
+					filename TEXT PRIMARY KEY,
+					id INTEGER,
+					slug TEXT,
+					format TEXT,
+					mtime INTEGER NOT NULL,
+					size INTEGER NOT NULL,
+					branches_count INTEGER,
+					chapters_count INTEGER,
+					empty_chapters_count INTEGER
+				);
+				CREATE INDEX IF NOT EXISTS titles_id ON titles (id);
+				CREATE INDEX IF NOT EXISTS titles_slug ON titles (slug);
+			""")
+
+		return self.__Connection
+
+	def __GenerateRecord(self, filename: str, stat: os.stat_result, data: dict | None) -> tuple:
+		"""
+		Генерирует запись каталога для описательного файла.
+
+		:param filename: Имя файла без расширения.
+		:type filename: str
+		:param stat: Сведения о файле.
+		:type stat: os.stat_result
+		:param data: Данные тайтла или `None`, если файл не удалось прочитать. Для шардированного тайтла количество глав берётся из метаданных ветвей, а количество пустых глав не определяется. Для заголовка без контента счётчики глав и ветвей не определяются.
+		:type data: dict | None
+		:return: Запись каталога.
+		:rtype: tuple
+		"""
+
+		if data == None: return (filename, None, None, None, stat.st_mtime_ns, stat.st_size, None, None, None)
+		if "content" not in data and not IsShardedTitle(data): return (filename, data.get("id"), data.get("slug"), data.get("format"), stat.st_mtime_ns, stat.st_size, None, None, None)
+
+		Content: dict = data.get("content") or dict()
+
+		if IsShardedTitle(data) and not Content:
+			ChaptersCount = sum(Branch["chapters_count"] for Branch in data.get("branches", list()))
+			return (filename, data.get("id"), data.get("slug"), data.get("format"), stat.st_mtime_ns, stat.st_size, len(data["shards"]), ChaptersCount, None)
+
+		ChaptersCount = 0
+		EmptyChaptersCount = 0
+
+		for Chapters in Content.values():
+			ChaptersCount += len(Chapters)
+
+			for CurrentChapter in Chapters:
+				if not CurrentChapter.get("slides") and not CurrentChapter.get("paragraphs"): EmptyChaptersCount += 1
+
+		return (filename, data.get("id"), data.get("slug"), data.get("format"), stat.st_mtime_ns, stat.st_size, len(Content), ChaptersCount, EmptyChaptersCount)
+
+	def __ReadRecord(self, directory: PathLike, filename: str, stat: os.stat_result) -> tuple:
+		"""
+		Считывает заголовок описательного файла и генерирует для него запись каталога. Счётчики глав и ветвей заполняются только при сохранении тайтла.
+
+		:param directory: Каталог описательных файлов.
+		:type directory: PathLike
+		:param filename: Имя файла без расширения.
+		:type filename: str
+		:param stat: Сведения о файле.
+		:type stat: os.stat_result
+		:return: Запись каталога.
+		:rtype: tuple
+		"""
+
+		return self.__GenerateRecord(filename, stat, self.__CheckHeader(ReadTitleHeaders((f"{directory}/{filename}.json",))[0]))
+
+	def __Upsert(self, records: Iterable[tuple]):
+		"""
+		Добавляет или обновляет записи каталога.
+
+		:param records: Последовательность записей.
+		:type records: Iterable[tuple]
+		"""
+
+		with self.__Connect() as Connection: Connection.executemany("INSERT OR REPLACE INTO titles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", records)
+
+	#==========================================================================================#
+	# >>>>> ПУБЛИЧНЫЕ МЕТОДЫ <<<<< #
+	#==========================================================================================#
+
+	def __init__(self, shared_data: "SharedData"):
+		"""
+		Каталог описательных файлов парсера, хранящий основные сведения о тайтлах в базе данных SQLite.
+
+		:param shared_data: Разделяемые в контексте одного парсера данные.
+		:type shared_data: SharedData
+		"""
+
+		self.__SharedData = shared_data
+
+		self.__Connection: sqlite3.Connection | None = None
+		self.__RefreshedDirectories: set[PathLike] = set()
+		self.__Locker = RLock()
+
+	def close(self):
+		"""Закрывает соединение с базой данных каталога."""
+
+		with self.__Locker:
+			if self.__Connection: self.__Connection.close()
+			self.__Connection = None
+
+	def drop(self):
+		"""Сбрасывает каталог."""
+
+		with self.__Locker, self.__Connect() as Connection: Connection.execute("DELETE FROM titles")
+
+	def get_errors(self) -> tuple[str]:
+		"""
+		Возвращает имена описательных файлов, которые не удалось прочитать.
+
+		:return: Последовательность имён файлов без расширения.
+		:rtype: tuple[str]
+		"""
+
+		with self.__Locker: return tuple(Row[0] for Row in self.__Connect().execute("SELECT filename FROM titles WHERE id IS NULL OR slug IS NULL ORDER BY filename"))
+
+	def get_filename_by_id(self, title_id: int) -> str | None:
+		"""
+		Ищет имя описательного файла по ID тайтла.
+
+		:param title_id: ID тайтла.
+		:type title_id: int
+		:return: Имя файла без расширения или `None` при отсутствии записи.
+		:rtype: str | None
+		"""
+
+		with self.__Locker: Row = self.__Connect().execute("SELECT filename FROM titles WHERE id = ?", (title_id,)).fetchone()
+
+		return Row[0] if Row else None
+
+	def get_filename_by_slug(self, slug: str) -> str | None:
+		"""
+		Ищет имя описательного файла по алиасу тайтла.
+
+		:param slug: Алиас тайтла.
+		:type slug: str
+		:return: Имя файла без расширения или `None` при отсутствии записи.
+		:rtype: str | None
+		"""
+
+		with self.__Locker: Row = self.__Connect().execute("SELECT filename FROM titles WHERE slug = ?", (slug,)).fetchone()
+
+		return Row[0] if Row else None
+
+	def get_pairs(self) -> tuple[tuple[int, str]]:
+		"""
+		Возвращает пары ID-алиас всех успешно прочитанных тайтлов.
+
+		:return: Последовательность пар ID-алиас.
+		:rtype: tuple[tuple[int, str]]
+		"""
+
+		with self.__Locker: return tuple(self.__Connect().execute("SELECT id, slug FROM titles WHERE id IS NOT NULL AND slug IS NOT NULL ORDER BY filename"))
+
+	def get_record(self, directory: PathLike, filename: str) -> dict | None:
+		"""
+		Возвращает запись каталога для описательного файла, при необходимости обновляя её.
+
+		:param directory: Каталог описательных файлов.
+		:type directory: PathLike
+		:param filename: Имя файла без расширения.
+		:type filename: str
+		:return: Словарь записи с ключами _filename_, _id_, _slug_, _format_, _mtime_, _size_, _branches\_count_, _chapters\_count_ и _empty\_chapters\_count_ или `None` при отсутствии файла.
+		:rtype: dict | None
+		"""
+
+		Path = f"{directory}/{filename}.json"
+		if not os.path.exists(Path): return
+
+		Stat = os.stat(Path)
+
+		with self.__Locker:
+			Cursor = self.__Connect().execute("SELECT * FROM titles WHERE filename = ?", (filename,))
+			Row = Cursor.fetchone()
+
+			if not Row or Row[4] != Stat.st_mtime_ns or Row[5] != Stat.st_size:
+				Row = self.__ReadRecord(directory, filename, Stat)
+				self.__Upsert((Row,))
+
+			return dict(zip((Column[0] for Column in Cursor.description), Row))
+
+	def get_values(self, column: str) -> list[int] | list[str]:
+		"""
+		Возвращает значения ID или алиасов всех успешно прочитанных тайтлов.
+
+		:param column: Название столбца: _id_ или _slug_.
+		:type column: str
+		:raises ValueError: Выбрасывается при неподдерживаемом названии столбца.
+		:return: Список значений.
+		:rtype: list[int] | list[str]
+		"""
+
+		if column not in ("id", "slug"): raise ValueError(column)
+
+		with self.__Locker: return [Row[0] for Row in self.__Connect().execute(f"SELECT {column} FROM titles WHERE {column} IS NOT NULL ORDER BY filename")]
+
+	def refresh(self, directory: PathLike, lazy: bool = False):
+		"""
+		Инкрементно обновляет каталог: перечитываются только новые и изменённые по времени модификации или размеру файлы, а записи удалённых файлов исключаются.
+
+		:param directory: Каталог описательных файлов.
+		:type directory: PathLike
+		:param lazy: Указывает, нужно ли пропустить обновление, если каталог уже обновлялся в течение текущего запуска. Записанные за это время файлы заносятся в каталог методом `update()`.
+		:type lazy: bool
+		"""
+
+		if not os.path.exists(directory): return
+
+		with self.__Locker:
+			if lazy and directory in self.__RefreshedDirectories: return
+			self.__RefreshedDirectories.add(directory)
+			Known = {Row[0]: (Row[1], Row[2]) for Row in self.__Connect().execute("SELECT filename, mtime, size FROM titles")}
+			Changed = list()
+			Filenames = set()
+
+			for Element in os.scandir(directory):
+				if not Element.is_file() or not Element.name.endswith(".json"): continue
+				Filename = Element.name[:-5]
+				Filenames.add(Filename)
+				Stat = Element.stat()
+				if Known.get(Filename) != (Stat.st_mtime_ns, Stat.st_size): Changed.append((Filename, Stat))
+
+			Headers = ReadTitleHeaders((f"{directory}/{Filename}.json" for Filename, _ in Changed))
+			Records = [self.__GenerateRecord(Filename, Stat, self.__CheckHeader(Header)) for (Filename, Stat), Header in zip(Changed, Headers)]
+
+			Removed = tuple((Filename,) for Filename in Known.keys() if Filename not in Filenames)
+
+			with self.__Connect() as Connection:
+				Connection.executemany("INSERT OR REPLACE INTO titles VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", Records)
+				Connection.executemany("DELETE FROM titles WHERE filename = ?", Removed)
+
+	def update(self, path: PathLike, data: dict):
+		"""
+		Обновляет запись каталога для только что записанного описательного файла.
+
+		:param path: Путь к описательному файлу.
+		:type path: PathLike
+		:param data: Записанные данные тайтла.
+		:type data: dict
+		"""
+
+		Filename = os.path.basename(path)[:-5]
+
+		with self.__Locker: self.__Upsert((self.__GenerateRecord(Filename, os.stat(path), data),))
 
 class SharedData:
 	"""Разделяемые в контексте одного парсера данные."""
@@ -89,6 +459,12 @@ class SharedData:
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
 
+	@property
+	def catalog(self) -> Catalog:
+		"""Каталог описательных файлов."""
+
+		return self.__Catalog
+
 	@property
 	def journal(self) -> Journal:
 		"""Журнал определений тайтлов."""
@@ -114,43 +490,76 @@ class SharedData:
 	# >>>>> СВОЙСТВА <<<<< #
 	#==========================================================================================#
 
-	def __init__(self, temper: "Temper"):
+	def __init__(self, temper: "Temper", save_interval: float = 5.0):
 		"""
-		Разделяемые в контексте одного парсера данные.
+		Разделяемые в контексте одного парсера данные. Изменения записываются атомарно и не чаще заданного интервала, а отложенные записи сохраняются при завершении интерпретатора.
 
 		:param temper: Дескриптор временных каталогов и объектов.
 		:type temper: Temper
+		:param save_interval: Минимальный интервал в секундах между записями разделяемых данных.
+		:type save_interval: float
 		"""
 
 		self.__Temper = temper
+		self.__SaveInterval = save_interval
 
 		self.__Journal = Journal(self)
+		self.__Catalog = Catalog(self)
 		self.__Data = {
 			"last_parsed_slug": None
 		}
+		self.__IsChanged = False
+		self.__LastSave = None
+		self.__Locker = RLock()
+
+		atexit.register(self.close)
+
+	def close(self):
+		"""Записывает несохранённые изменения и освобождает ресурсы разделяемых данных."""
+
+		self.flush()
+		self.__Journal.close()
+		self.__Catalog.close()
+
+	def flush(self):
+		"""Записывает разделяемые данные, если в них есть несохранённые изменения."""
+
+		with self.__Locker:
+			if self.__IsChanged: self.save()
 
 	def load(self):
 		"""Загружает разделяемые данные."""
 
 		Path = f"{self.path}/shared.json"
-		if os.path.exists(Path): self.__Data = ReadJSON(Path)
+
+		with self.__Locker:
+			self.__Data = ReadJSON(Path) if os.path.exists(Path) else {"last_parsed_slug": None}
+			self.__IsChanged = False
+
 		self.__Journal.load()
+		self.__Catalog.close()
 
 	def set_last_parsed_slug(self, slug: str):
 		"""
-		Задаёт алиас последнего обработанного парсером тайтла.
+		Задаёт алиас последнего обработанного парсером тайтла. Запись откладывается, если с прошлой записи прошло меньше заданного интервала.
 
 		:param slug: Алиас.
 		:type slug: str
 		"""
 
-		self.__Data["last_parsed_slug"] = slug
-		self.save()
+		with self.__Locker:
+			if self.__Data["last_parsed_slug"] == slug: return
+			self.__Data["last_parsed_slug"] = slug
+			self.__IsChanged = True
+			if self.__LastSave == None or monotonic() - self.__LastSave >= self.__SaveInterval: self.save()
 		
 	def save(self):
-		"""Сохраняет разделяемые данные."""
+		"""Атомарно сохраняет разделяемые данные."""
 
-		WriteJSON(f"{self.path}/shared.json", self.__Data)
+		with self.__Locker:
+			_WriteJSONAtomically(f"{self.path}/shared.json", self.__Data)
+			self.__IsChanged = False
+			self.__LastSave = monotonic()
 
 #==========================================================================================#
 # >>>>> ОСНОВНОЙ КЛАСС <<<<< #
@@ -250,6 +659,11 @@ class Temper:
 			if Descriptor.is_file(): os.remove(Descriptor.path)
 			elif Descriptor.is_dir(): shutil.rmtree(Descriptor.path)
 
+	def close(self):
+		"""Записывает несохранённые изменения разделяемых данных выбранного парсера."""
+
+		if self.__ParserName: self.__SharedData.close()
+
 	def select_extension(self, extension: str):
 		"""
 		Задаёт имя используемого расширения.
@@ -268,6 +682,7 @@ class Temper:
 		:type parser_name: str
 		"""
 
+		self.close()
 		self.__ParserName = parser_name
 		self.__SharedData.load()
 
@@ -1,5 +1,6 @@
 from Source.Core.SystemObjects.Controller import Controller
 from Source.Core.SystemObjects.Logger import Logger
+from Source.Core.SystemObjects.Sessions import Sessions
 from Source.Core.SystemObjects.Temper import Temper
 
 from packaging.version import Version
@@ -139,6 +140,12 @@ class SystemObjects:
 
 		return self.__ParserName
 
+	@property
+	def sessions(self) -> Sessions:
+		"""Менеджер разделяемых HTTP-сессий."""
+
+		return self.__Sessions
+
 	@property
 	def temper(self) -> Temper:
 		"""Дескриптор каталога временных файлов."""
@@ -155,6 +162,7 @@ class SystemObjects:
 		self.__Controller = Controller(self)
 		self.__Logger = Logger(self)
 		self.__Temper = Temper()
+		self.__Sessions = Sessions(self.__Logger)
 
 		self.__ExtensionName = None
 		self.__ParserName = None
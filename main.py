@@ -53,6 +53,11 @@ try:
 	
 except KeyboardInterrupt: pass
 
+finally:
+	# Отложенные записи журнала и разделяемых данных сохраняются даже при аварийном завершении команды.
+	Objects.temper.close()
+	Objects.sessions.close()
+
 #==========================================================================================#
 # >>>>> ЗАВЕРШЕНИЕ РАБОТЫ <<<<< #
 #==========================================================================================#